@@ -108,6 +108,7 @@ class Wilson(ConfigurableClass):
     # default config options:
     # dictionary with option name as 'key' and default option value as 'value'
     _default_options = {'smeft_accuracy': 'integrate',
+                        'smeft_tolerance': 1e-3,
                         'qed_order': 1,
                         'qcd_order': 1,
                         'smeft_matching_order': 0,
@@ -120,7 +121,8 @@ class Wilson(ConfigurableClass):
     # option schema:
     # Voluptuous schema defining allowed option values/types
     _option_schema = vol.Schema({
-        'smeft_accuracy': vol.In(['integrate','leadinglog']),
+        'smeft_accuracy': vol.In(['integrate', 'implicit', 'linear', 'exponential', 'taylor', 'leadinglog', 'auto']),
+        'smeft_tolerance': vol.Coerce(float),
         'qed_order': vol.In([0,1]),
         'qcd_order': vol.In([0,1]),
         'smeft_matching_order':  vol.In([0,1]),
@@ -148,6 +150,9 @@ class Wilson(ConfigurableClass):
                           values=wcxf.WC.dict2values(wcdict))
         self.wc.validate()
         self._cache = {}
+        self._smeft = None
+        # information on the last SMEFT running, see `SMEFT.run`
+        self.smeft_run_info = None
 
     def __hash__(self):
         """Return a hash of the `Wilson` instance.
@@ -192,12 +197,30 @@ class Wilson(ConfigurableClass):
         return p
 
 
+    def _smeftrun_opt(self):
+        """Return a dictionary of keyword arguments to pass to
+        `run.smeft.SMEFT.run`."""
+        if self.get_option('smeft_accuracy') == 'auto':
+            return {'tolerance': self.get_option('smeft_tolerance')}
+        return {}
+
     def _wetrun_opt(self):
         """Return a dictionary of options to pass to a `run.wet.WETrunner`
         instance."""
         return {'qed_order': self.get_option('qed_order'),
                 'qcd_order': self.get_option('qcd_order')}
 
+    def _get_smeft(self):
+        """Return the `SMEFT` instance for the input Wilson coefficients.
+
+        The instance is kept until the cache is cleared, such that the SM
+        parameters at the input scale are determined only once and the
+        SMEFT running can resume from previously computed scales."""
+        if self._smeft is None:
+            get_smpar = self.get_option('smeft_accuracy') != 'linear'
+            self._smeft = SMEFT(self.wc.translate('Warsaw', parameters=self.parameters), get_smpar=get_smpar)
+        return self._smeft
+
     def match_run(self, scale, eft, basis, sectors='all'):
         """Run the Wilson coefficients to a different scale
         (and possibly different EFT)
@@ -233,10 +256,17 @@ class Wilson(ConfigurableClass):
             return wc_out
         if self.wc.eft == 'SMEFT':
             smeft_accuracy = self.get_option('smeft_accuracy')
+            # the linear approximation uses the SM parameters obtained
+            # for vanishing Wilson coefficients
+            get_smpar = smeft_accuracy != 'linear'
             if eft == 'SMEFT':
-                smeft = SMEFT(self.wc.translate('Warsaw', sectors=translate_sectors, parameters=self.parameters))
+                if translate_sectors is None:
+                    smeft = self._get_smeft()
+                else:
+                    smeft = SMEFT(self.wc.translate('Warsaw', sectors=translate_sectors, parameters=self.parameters), get_smpar=get_smpar)
                 # if input and output EFT ist SMEFT, just run.
-                wc_out = smeft.run(scale, accuracy=smeft_accuracy).translate(basis)
+                wc_out = smeft.run(scale, accuracy=smeft_accuracy, resume=True, **self._smeftrun_opt()).translate(basis)
+                self.smeft_run_info = smeft.run_info
                 self._set_cache('all', scale, 'SMEFT', wc_out.basis, wc_out)
                 return wc_out
             else:
@@ -246,8 +276,9 @@ class Wilson(ConfigurableClass):
                     if self.wc.scale == scale_ew:
                         wc_ew = self.wc.match('WET', 'JMS', parameters=self.matching_parameters)  # no need to run
                     else:
-                        smeft = SMEFT(self.wc.translate('Warsaw', parameters=self.parameters))
-                        wc_ew = smeft.run(scale_ew, accuracy=smeft_accuracy).match('WET', 'JMS', parameters=self.matching_parameters)
+                        smeft = self._get_smeft()
+                        wc_ew = smeft.run(scale_ew, accuracy=smeft_accuracy, resume=True, **self._smeftrun_opt()).match('WET', 'JMS', parameters=self.matching_parameters)
+                        self.smeft_run_info = smeft.run_info
                 self._set_cache('all', scale_ew, wc_ew.eft, wc_ew.basis, wc_ew)
                 wet = WETrunner(wc_ew, **self._wetrun_opt())
         elif self.wc.eft in ['WET', 'WET-4', 'WET-3']:
@@ -281,8 +312,34 @@ class Wilson(ConfigurableClass):
         else:
             raise ValueError(f"Running from {wet.eft} to {eft} not implemented")
 
+    def match_run_many(self, scales, eft, basis, sectors='all'):
+        """Run the Wilson coefficients to several scales
+        (and possibly different EFT)
+        and return them as list of `wcxf.WC` instances.
+
+        The parameters are as in `match_run`, but with a list of output
+        scales `scales`. If both input and output EFT are SMEFT, the SMEFT
+        RGEs are integrated only once for all scales.
+        """
+        if self.wc.eft == 'SMEFT' and eft == 'SMEFT' and sectors == 'all':
+            missing = [scale for scale in scales
+                       if scale != self.wc.scale
+                       and self._get_from_cache(sector='all', scale=scale, eft=eft, basis=basis) is None]
+            if missing:
+                smeft_accuracy = self.get_option('smeft_accuracy')
+                smeft = self._get_smeft()
+                wcs = smeft.run_many(missing, accuracy=smeft_accuracy, resume=True, **self._smeftrun_opt())
+                self.smeft_run_info = smeft.run_info
+                for scale, wc in zip(missing, wcs):
+                    wc_out = wc.translate(basis)
+                    self._set_cache('all', scale, 'SMEFT', wc_out.basis, wc_out)
+        return [self.match_run(scale, eft, basis, sectors=sectors)
+                for scale in scales]
+
     def clear_cache(self):
         self._cache = {}
+        # also discards the SMEFT running checkpoints
+        self._smeft = None
 
     def _get_from_cache(self, sector, scale, eft, basis):
         """Try to load a set of Wilson coefficients from the cache, else return
@@ -314,6 +371,8 @@ class RGsolution:
 
         - fun: function of the scale that is expected to return a
         dictionary with the RGE solution and to accept vectorized input.
+        For an array of scales, it can return either an array of
+        dictionaries or a dictionary of arrays.
         - scale_min, scale_max: lower and upper boundaries of the scale
         """
         self.fun = fun
@@ -343,7 +402,10 @@ class RGsolution:
                             self.scale_max,
                             steps)
         y = self.fun(x)
-        y = np.array([d[key] for d in y])
+        if isinstance(y, dict):
+            y = np.asarray(y[key])
+        else:
+            y = np.array([d[key] for d in y])
         if part == 're':
             return x, y.real
         elif part == 'im':
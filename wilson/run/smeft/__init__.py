@@ -8,4 +8,4 @@ Ported from the [DsixTools](https://dsixtools.github.io) Mathematica package.
 from . import beta
 from . import classes
 from . import rge
-from .classes import SMEFT
+from .classes import SMEFT, run_batch
@@ -2,14 +2,46 @@
 
 from . import rge
 from . import smpar
-from math import sqrt
+from . import beta
+from math import sqrt, log
+from time import perf_counter
+from functools import lru_cache
 import numpy as np
 import ckmutil.phases, ckmutil.diag
 import wilson
-from wilson.util import smeftutil
+from wilson.util import smeftutil, smeft_warsaw, rotation
 from wilson import wcxf
 
 
+@lru_cache(32)
+def _get_sm_scale_in_sm_cached(scale_in, sm_inputs):
+    smeft = SMEFT(wcxf.WC('SMEFT', 'Warsaw', scale_in, {}))
+    return {k: smeft.C_in[k] for k in smeftutil.dim4_keys}
+
+
+def _get_sm_scale_in_sm(scale_in):
+    """Return the SM parameters at `scale_in` for vanishing Wilson
+    coefficients, cached for given SM input parameters `smpar.p`."""
+    sm_inputs = tuple(sorted(smpar.p.items()))
+    return _get_sm_scale_in_sm_cached(scale_in, sm_inputs).copy()
+
+
+# cache for `SMEFT._get_sm_scale_in`
+_sm_scale_in_cache = {}
+_SM_SCALE_IN_CACHE_SIZE = 128
+
+
+@lru_cache(1)
+def _sm_scale_in_keys():
+    """Return the names of the Wilson coefficients affecting the SM
+    parameters obtained by `SMEFT._get_sm_scale_in`, i.e. the ones entering
+    the extraction of SM parameters or the beta functions of the SM
+    parameters, and the ones mixing into them at leading log."""
+    keys = set(smpar.SMEFTPAR_KEYS) | set(beta.SM_BETA_KEYS)
+    keys |= {k for k, v in beta.mixing_graph().items() if v & keys}
+    return tuple(k for k in smeftutil.WC_keys if k in keys)
+
+
 class SMEFT:
     """Class representing a parameter point in the Standard Model Effective
     Field Theory and allowing the evolution of the Wilson Coefficients.
@@ -30,6 +62,9 @@ class SMEFT:
         self.wc = wc
         self.scale_in = None
         self.C_in = None
+        self._checkpoints = {}
+        # information on the last call of `run`
+        self.run_info = None
         if wc is not None:
             self._set_initial_wcxf(wc, get_smpar=get_smpar)
 
@@ -38,6 +73,7 @@ class SMEFT:
         the scale `scale_in`."""
         self.C_in = C_in
         self.scale_in = scale_in
+        self._checkpoints = {}
 
     def _set_initial_wcxf(self, wc, get_smpar=True):
         """Load the initial values for Wilson coefficients from a
@@ -75,30 +111,64 @@ class SMEFT:
             self.C_in.update(C)
         if get_smpar:
             self.C_in.update(self._get_sm_scale_in())
+        self._checkpoints = {}
 
-    def _to_wcxf(self, C_out, scale_out):
+    def _to_wcxf(self, C_out, scale_out, rotation_matrices=None):
         """Return the Wilson coefficients `C_out` as a wcxf.WC instance.
 
         Note that the Wilson coefficients are rotated into the Warsaw basis
         as defined in WCxf, i.e. to the basis where the down-type and charged
-        lepton mass matrices are diagonal."""
-        C = self._rotate_defaultbasis(C_out)
+        lepton mass matrices are diagonal. Optionally, the rotation
+        matrices can be provided as dictionary `rotation_matrices` (see
+        `_defaultbasis_rotation`)."""
+        t_start = perf_counter()
+        C = self._rotate_defaultbasis(C_out, rotation_matrices=rotation_matrices)
+        if self.run_info is not None:
+            timings = self.run_info['timings']
+            timings['rotation'] = (timings.get('rotation', 0)
+                                   + perf_counter() - t_start)
         d = wilson.util.smeftutil.arrays2wcxf_nonred(C)
         d = wcxf.WC.dict2values(d)
         wc = wcxf.WC('SMEFT', 'Warsaw', scale_out, d)
         return wc
 
-    def _rgevolve(self, scale_out, **kwargs):
+    def _rgevolve(self, scale_out, info=None, **kwargs):
         """Solve the SMEFT RGEs from the initial scale to `scale_out`.
         Returns a dictionary with parameters and Wilson coefficients at
-        `scale_out`. Additional keyword arguments will be passed to
-        the ODE solver `scipy.integrate.odeint`."""
+        `scale_out`. Solver statistics and timings are added to the
+        dictionary `info` if given. Additional keyword arguments will be
+        passed to the ODE solver `scipy.integrate.solve_ivp`."""
         self._check_initial()
         return rge.smeft_evolve(C_in=self.C_in,
                             scale_in=self.scale_in,
                             scale_out=scale_out,
+                            info=info,
                             **kwargs)
 
+    def _get_checkpoints(self, **kwargs):
+        """Return the dictionary with scales as keys and the numerical
+        solutions of the SMEFT RGEs obtained with the ODE solver options
+        `kwargs` as values, including the initial values."""
+        key = repr(sorted(kwargs.items()))
+        if key not in self._checkpoints:
+            self._checkpoints[key] = {self.scale_in: self.C_in}
+        return self._checkpoints[key]
+
+    def _rgevolve_resume(self, scale_out, info=None, **kwargs):
+        """Solve the SMEFT RGEs like `_rgevolve`, but starting from the
+        stored solution (checkpoint) closest to `scale_out` rather than from
+        the initial scale, and store the solution at `scale_out`."""
+        self._check_initial()
+        checkpoints = self._get_checkpoints(**kwargs)
+        scale_start = min(checkpoints, key=lambda scale: abs(log(scale / scale_out)))
+        if scale_start != scale_out:
+            checkpoints[scale_out] = rge.smeft_evolve(C_in=checkpoints[scale_start],
+                                                     scale_in=scale_start,
+                                                     scale_out=scale_out,
+                                                     info=info,
+                                                     **kwargs)
+        return checkpoints[scale_out]
+
     def _rgevolve_leadinglog(self, scale_out):
         """Compute the leading logarithmic approximation to the solution
         of the SMEFT RGEs from the initial scale to `scale_out`.
@@ -110,6 +180,59 @@ class SMEFT:
                             scale_in=self.scale_in,
                             scale_out=scale_out)
 
+    def _rgevolve_exponential(self, scale_out, **kwargs):
+        """Solve the SMEFT RGEs from the initial scale to `scale_out`
+        piecewise exponentially (see `rge.smeft_evolve_exponential`).
+        Returns a dictionary with parameters and Wilson coefficients at
+        `scale_out`."""
+        self._check_initial()
+        return rge.smeft_evolve_exponential(C_in=self.C_in,
+                            scale_in=self.scale_in,
+                            scale_out=scale_out,
+                            **kwargs)
+
+    def _rgevolve_taylor(self, scale_out, order=2):
+        """Compute the Taylor expansion in $\\log\\mu$ of order `order` of
+        the solution of the SMEFT RGEs from the initial scale to `scale_out`
+        (see `rge.smeft_evolve_taylor`).
+        Returns a dictionary with parameters and Wilson coefficients."""
+        self._check_initial()
+        return rge.smeft_evolve_taylor(C_in=self.C_in,
+                            scale_in=self.scale_in,
+                            scale_out=scale_out,
+                            order=order)
+
+    def _rgevolve_linear(self, scale_out, **kwargs):
+        """Solve the SMEFT RGEs from the initial scale to `scale_out` to
+        linear order in the Wilson coefficients (see
+        `rge.smeft_evolve_linear`), using the SM parameters at the initial
+        scale obtained for vanishing Wilson coefficients.
+        Returns a dictionary with parameters and Wilson coefficients at
+        `scale_out`."""
+        self._check_initial()
+        C_in = self.C_in.copy()
+        C_in.update(_get_sm_scale_in_sm(self.scale_in))
+        return rge.smeft_evolve_linear(C_in=C_in,
+                            scale_in=self.scale_in,
+                            scale_out=scale_out,
+                            **kwargs)
+
+    def _rgevolve_symmetric(self, scale_out, flavor_symmetry, info=None,
+                            **kwargs):
+        """Solve the SMEFT RGEs from the initial scale to `scale_out` for the
+        Wilson coefficients invariant under `flavor_symmetry` (see
+        `rge.smeft_evolve_symmetric`).
+        Returns a dictionary with parameters and Wilson coefficients at
+        `scale_out`. Solver statistics and timings are added to the
+        dictionary `info` if given."""
+        self._check_initial()
+        return rge.smeft_evolve_symmetric(C_in=self.C_in,
+                            scale_in=self.scale_in,
+                            scale_out=scale_out,
+                            flavor_symmetry=flavor_symmetry,
+                            info=info,
+                            **kwargs)
+
     def _check_initial(self):
         """Check if initial values and scale as well as the new physics scale
         have been set."""
@@ -119,12 +242,23 @@ class SMEFT:
             raise Exception("You have to specify the initial scale first.")
 
     @staticmethod
-    def _rotate_defaultbasis(C):
+    def _rotate_defaultbasis(C, rotation_matrices=None):
         """Rotate all parameters to the basis where the running down-type quark
         and charged lepton mass matrices are diagonal and where the running
         up-type quark mass matrix has the form V.S, with V unitary and S real
         diagonal, and where the CKM and PMNS matrices have the standard
-        phase convention."""
+        phase convention.
+
+        If `rotation_matrices` is given, it is used as dictionary of rotation
+        matrices instead of the one determined from `C`."""
+        if rotation_matrices is None:
+            rotation_matrices = SMEFT._defaultbasis_rotation(C)
+        return SMEFT._flavor_rotation(C, **rotation_matrices)
+
+    @staticmethod
+    def _defaultbasis_rotation(C):
+        """Return the dictionary of flavour rotation matrices used in
+        `_rotate_defaultbasis`."""
         v = 246.22
         Mep = v/sqrt(2) * (C['Ge'] - C['ephi'] * v**2/2)
         Mup = v/sqrt(2) * (C['Gu'] - C['uphi'] * v**2/2)
@@ -136,80 +270,32 @@ class SMEFT:
         Unu, Mnu = ckmutil.diag.mtakfac(Mnup)
         UuL, UdL, UuR, UdR = ckmutil.phases.rephase_standard(UuL, UdL, UuR, UdR)
         Unu, UeL, UeR = ckmutil.phases.rephase_pmns_standard(Unu, UeL, UeR)
-        return SMEFT._flavor_rotation(C, Uq=UdL, Uu=UuR, Ud=UdR, Ul=UeL, Ue=UeR)
+        return {'Uq': UdL, 'Uu': UuR, 'Ud': UdR, 'Ul': UeL, 'Ue': UeR}
 
     @staticmethod
     def _flavor_rotation(C_in, Uq, Uu, Ud, Ul, Ue, sm_parameters=True):
         """Gauge-invariant $U(3)^5$ flavor rotation of all Wilson coefficients and
         SM parameters."""
         C = {}
+        rules = dict(smeft_warsaw.flavor_rotation_rules)
         if sm_parameters:
             # nothing to do for scalar SM parameters
             for k in ['g', 'gp', 'gs', 'Lambda', 'm2']:
                 C[k] = C_in[k]
-            C['Ge'] = Ul.conj().T @ C_in['Ge'] @ Ue
-            C['Gu'] = Uq.conj().T @ C_in['Gu'] @ Uu
-            C['Gd'] = Uq.conj().T @ C_in['Gd'] @ Ud
+        else:
+            for k in ['Ge', 'Gu', 'Gd']:
+                del rules[k]
         # nothing to do for purely bosonic operators
         for k in smeftutil.WC_keys_0f:
             C[k] = C_in[k]
-        # see 1704.03888 table 4 (but staying SU(2) invariant here)
-        # LR
-        for k in ['ephi', 'eW', 'eB']:
-            C[k] = Ul.conj().T @ C_in[k] @ Ue
-        for k in ['uphi', 'uW', 'uB', 'uG']:
-            C[k] = Uq.conj().T @ C_in[k] @ Uu
-        for k in ['dphi', 'dW', 'dB', 'dG']:
-            C[k] = Uq.conj().T @ C_in[k] @ Ud
-        # LL
-        for k in ['phil1', 'phil3']:
-            C[k] = Ul.conj().T @ C_in[k] @ Ul
-        for k in ['phiq1', 'phiq3']:
-            C[k] = Uq.conj().T @ C_in[k] @ Uq
-        C['llphiphi'] = Ul.T @ C_in['llphiphi'] @ Ul
-        # RR
-        C['phie'] = Ue.conj().T @ C_in['phie'] @ Ue
-        C['phiu'] = Uu.conj().T @ C_in['phiu'] @ Uu
-        C['phid'] = Ud.conj().T @ C_in['phid'] @ Ud
-        C['phiud'] = Uu.conj().T @ C_in['phiud'] @ Ud
-        # 4-fermion
-        C['ll'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Ul, Ul.conj(), Ul.conj(), C_in['ll'])
-        C['ee'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Ue, Ue.conj(), Ue.conj(), C_in['ee'])
-        C['le'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Ue, Ul.conj(), Ue.conj(), C_in['le'])
-        C['qq1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Uq, Uq.conj(), Uq.conj(), C_in['qq1'])
-        C['qq3'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Uq, Uq.conj(), Uq.conj(), C_in['qq3'])
-        C['dd'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ud, Ud, Ud.conj(), Ud.conj(), C_in['dd'])
-        C['uu'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Uu, Uu.conj(), Uu.conj(), C_in['uu'])
-        C['ud1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ud, Uu.conj(), Ud.conj(), C_in['ud1'])
-        C['ud8'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ud, Uu.conj(), Ud.conj(), C_in['ud8'])
-        C['qu1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Uu, Uq.conj(), Uu.conj(), C_in['qu1'])
-        C['qu8'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Uu, Uq.conj(), Uu.conj(), C_in['qu8'])
-        C['qd1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Ud, Uq.conj(), Ud.conj(), C_in['qd1'])
-        C['qd8'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Ud, Uq.conj(), Ud.conj(), C_in['qd8'])
-        C['quqd1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ud, Uq.conj(), Uq.conj(), C_in['quqd1'])
-        C['quqd8'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ud, Uq.conj(), Uq.conj(), C_in['quqd8'])
-        C['lq1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Uq, Ul.conj(), Uq.conj(), C_in['lq1'])
-        C['lq3'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Uq, Ul.conj(), Uq.conj(), C_in['lq3'])
-        C['ld'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Ud, Ul.conj(), Ud.conj(), C_in['ld'])
-        C['lu'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ul, Uu, Ul.conj(), Uu.conj(), C_in['lu'])
-        C['qe'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Ue, Uq.conj(), Ue.conj(), C_in['qe'])
-        C['ed'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Ud, Ue.conj(), Ud.conj(), C_in['ed'])
-        C['eu'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Uu, Ue.conj(), Uu.conj(), C_in['eu'])
-        C['ledq'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Uq, Ul.conj(), Ud.conj(), C_in['ledq'])
-        C['lequ1'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Uu, Ul.conj(), Uq.conj(), C_in['lequ1'])
-        C['lequ3'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Ue, Uu, Ul.conj(), Uq.conj(), C_in['lequ3'])
-        C['duql'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ul, Ud, Uq, C_in['duql'])
-        C['qque'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Ue, Uq, Uu, C_in['qque'])
-        C['qqql'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uq, Ul, Uq, Uq, C_in['qqql'])
-        C['duue'] = np.einsum('jb,ld,ia,kc,ijkl->abcd', Uu, Ue, Ud, Uu, C_in['duue'])
+        C.update(rotation.rotate(C_in, rules,
+                                 dict(Uq=Uq, Uu=Uu, Ud=Ud, Ul=Ul, Ue=Ue)))
         return C
 
     def _run_sm_scale_in(self, C_out, scale_sm=91.1876):
         """Get the SM parameters at the EW scale, using an estimate `C_out`
         of the Wilson coefficients at that scale, and run them to the
         input scale."""
-        # initialize an empty SMEFT instance
-        smeft_sm = SMEFT(wc=None)
         C_in_sm = smeftutil.C_array2dict(np.zeros(9999))
         # set the SM parameters to the values obtained from smpar.smeftpar
         C_SM = smpar.smeftpar(scale_sm, C_out, basis='Warsaw')
@@ -218,9 +304,8 @@ class SMEFT:
         # set the Wilson coefficients at the EW scale to C_out
         C_in_sm.update(C_out)
         C_in_sm.update(C_SM)
-        smeft_sm._set_initial(C_in_sm, scale_sm)
         # run up (with 1% relative precision, ignore running of Wilson coefficients)
-        C_SM_high = smeft_sm._rgevolve(self.scale_in, newphys=False, rtol=0.001, atol=1)
+        C_SM_high = rge.smeft_evolve_sm(C_in_sm, scale_sm, self.scale_in, rtol=0.001, atol=1)
         C_SM_high = self._rotate_defaultbasis(C_SM_high)
         return {k: v for k, v in C_SM_high.items() if k in SM_keys}
 
@@ -245,19 +330,35 @@ class SMEFT:
         (corresponding to their leading log approximated values at the EW
         scale).
 
+        The result is cached for given values of the Wilson coefficients it
+        depends on (see `_sm_scale_in_keys`), input scale, and SM input
+        parameters `smpar.p`.
+
         Note that this is not guaranteed to work and will fail if some of the
         Wilson coefficients (the ones affecting the extraction of SM parameters)
         are large."""
-        # intialize a copy of ourselves
-        _smeft = SMEFT(self.wc, get_smpar=False)
-        # Step 1: run the SM up, using the WCs at scale_input as (constant) estimate
-        _smeft.C_in.update(self._run_sm_scale_in(self.C_in, scale_sm=scale_sm))
-        # Step 2: run the WCs down in LL approximation
-        C_out = _smeft._rgevolve_leadinglog(scale_sm)
-        # Step 3: run the SM up again, this time using the WCs at scale_sm as (constant) estimate
-        return self._run_sm_scale_in(C_out, scale_sm=scale_sm)
-
-    def run(self, scale, accuracy='integrate', **kwargs):
+        keys = _sm_scale_in_keys()
+        C_in = {k: np.asarray(self.C_in[k]) for k in keys}
+        key = (self.scale_in, scale_sm, tuple(sorted(smpar.p.items())),
+               tuple(C_in[k].tobytes() for k in keys))
+        if key not in _sm_scale_in_cache:
+            # intialize a SMEFT instance with the relevant Wilson coefficients only
+            _smeft = SMEFT(wc=None)
+            C = smeftutil.C_array2dict(np.zeros(9999))
+            C.update(C_in)
+            _smeft._set_initial(C, self.scale_in)
+            # Step 1: run the SM up, using the WCs at scale_input as (constant) estimate
+            _smeft.C_in.update(self._run_sm_scale_in(C, scale_sm=scale_sm))
+            # Step 2: run the WCs down in LL approximation
+            C_out = _smeft._rgevolve_leadinglog(scale_sm)
+            # Step 3: run the SM up again, this time using the WCs at scale_sm as (constant) estimate
+            if len(_sm_scale_in_cache) >= _SM_SCALE_IN_CACHE_SIZE:
+                del _sm_scale_in_cache[next(iter(_sm_scale_in_cache))]
+            _sm_scale_in_cache[key] = self._run_sm_scale_in(C_out, scale_sm=scale_sm)
+        return {k: np.copy(v) for k, v in _sm_scale_in_cache[key].items()}
+
+    def run(self, scale, accuracy='integrate', flavor_symmetry=None,
+            resume=False, **kwargs):
         """Return the Wilson coefficients  (as wcxf.WC instance) evolved to the
         scale `scale`.
 
@@ -265,17 +366,144 @@ class SMEFT:
 
         - `scale`: scale in GeV
         - accuracy: whether to use the numerical solution to the RGE
-        ('integrate', the default, slow but precise) or the leading logarithmic
-        approximation ('leadinglog', approximate but much faster).
+        ('integrate', the default, slow but precise), the numerical solution
+        obtained with an implicit ODE solver making use of the Jacobian of the
+        beta functions ('implicit', by default using the 'Radau' method),
+        the solution to linear order in the Wilson coefficients around the SM
+        trajectory ('linear', using a cached evolution matrix, see
+        `rge.smeft_evolve_linear`; the SM parameters at the input scale are
+        determined for vanishing Wilson coefficients), the piecewise
+        exponential solution ('exponential', see
+        `rge.smeft_evolve_exponential`; the number of segments can be set
+        with the keyword argument `segments`; the cost is not lower than
+        for 'integrate' but essentially fixed by their number), the Taylor
+        expansion in $\\log\\mu$ ('taylor', see `rge.smeft_evolve_taylor`;
+        the order can be set with the keyword argument `order`, by default
+        2), or the leading logarithmic approximation ('leadinglog',
+        approximate but much faster). With 'auto', the leading logarithmic approximation is used
+        if the estimate of its relative error (see
+        `rge.smeft_evolve_leadinglog_error`) does not exceed the keyword
+        argument `tolerance` (by default 0.001), otherwise the RGEs are
+        integrated numerically.
+        - flavor_symmetry: if not None, one of 'U(3)^5', 'U(2)^5', or 'MFV'.
+        Only the Wilson coefficients invariant under this flavor symmetry
+        are evolved, neglecting the symmetry breaking by the SM Yukawa
+        couplings (see `rge.smeft_evolve_symmetric`). Requires
+        accuracy='integrate'.
+
+        For accuracy='integrate', additional keyword arguments are passed to
+        the ODE solver `scipy.integrate.solve_ivp`. Besides its methods,
+        `method='RK4'` selects the classical Runge-Kutta method with a fixed
+        number `steps` of steps in $\\log\\mu$ (see `rge.RK4`), which makes the
+        cost independent of the parameter point.
+
+        After each call, the attribute `run_info` contains a dictionary with
+        the accuracy actually used (key 'accuracy'), for accuracy='auto',
+        the error estimate of the leading logarithmic approximation (key
+        'error_estimate'), for numerical integration, the statistics of the
+        ODE solver (key 'solver', see `rge._smeft_evolve`, otherwise None),
+        and the wall time in seconds spent in the beta functions ('beta'),
+        in their Jacobian ('jacobian'), in packing and unpacking the ODE
+        state ('packing'), in the rotation to the default flavour basis
+        ('rotation') and in total ('total') (key 'timings').
         """
+        t_start = perf_counter()
+        self.run_info = {'accuracy': accuracy, 'solver': None, 'timings': {}}
+        wc_out = self._run(scale, accuracy=accuracy,
+                           flavor_symmetry=flavor_symmetry, resume=resume,
+                           **kwargs)
+        self.run_info['timings']['total'] = perf_counter() - t_start
+        return wc_out
+
+    def _run(self, scale, accuracy='integrate', flavor_symmetry=None,
+             resume=False, **kwargs):
+        """Return the Wilson coefficients evolved to the scale `scale`,
+        see `run`."""
+        if accuracy == 'auto':
+            tolerance = kwargs.pop('tolerance', 1e-3)
+            error = None
+            if flavor_symmetry is None:
+                self._check_initial()
+                C_out, error = rge.smeft_evolve_leadinglog_error(
+                    C_in=self.C_in, scale_in=self.scale_in, scale_out=scale)
+                self.run_info['error_estimate'] = error
+                if error <= tolerance:
+                    self.run_info['accuracy'] = 'leadinglog'
+                    return self._to_wcxf(C_out, scale)
+            self.run_info['accuracy'] = 'integrate'
+            self.run_info['error_estimate'] = error
+            return self._run(scale, accuracy='integrate',
+                             flavor_symmetry=flavor_symmetry,
+                             resume=resume, **kwargs)
+        if flavor_symmetry is not None:
+            if accuracy != 'integrate':
+                raise ValueError("A flavor symmetry can only be used with accuracy='integrate'.")
+            C_out = self._rgevolve_symmetric(scale, flavor_symmetry,
+                                             info=self.run_info, **kwargs)
+            return self._to_wcxf(C_out, scale)
+        if accuracy == 'linear':
+            C_out = self._rgevolve_linear(scale, **kwargs)
+            # rotate with the rotation matrices of the SM trajectory to keep
+            # the result linear in the Wilson coefficients
+            C_sm = {k: v for k, v in C_out.items() if k in smeftutil.dim4_keys}
+            C_sm.update({k: np.zeros((3, 3)) for k in ['uphi', 'dphi', 'ephi', 'llphiphi']})
+            rotation_matrices = self._defaultbasis_rotation(C_sm)
+            return self._to_wcxf(C_out, scale, rotation_matrices=rotation_matrices)
         if accuracy == 'integrate':
-            C_out = self._rgevolve(scale, **kwargs)
+            if resume:
+                C_out = self._rgevolve_resume(scale, info=self.run_info,
+                                              **kwargs)
+            else:
+                C_out = self._rgevolve(scale, info=self.run_info, **kwargs)
+        elif accuracy == 'implicit':
+            kwargs.setdefault('method', 'Radau')
+            if kwargs['method'] not in rge.IMPLICIT_METHODS:
+                raise ValueError(f"'{kwargs['method']}' is not an implicit ODE solver.")
+            if resume:
+                C_out = self._rgevolve_resume(scale, info=self.run_info,
+                                              **kwargs)
+            else:
+                C_out = self._rgevolve(scale, info=self.run_info, **kwargs)
+        elif accuracy == 'exponential':
+            C_out = self._rgevolve_exponential(scale, **kwargs)
+        elif accuracy == 'taylor':
+            C_out = self._rgevolve_taylor(scale, **kwargs)
         elif accuracy == 'leadinglog':
             C_out = self._rgevolve_leadinglog(scale)
         else:
-            raise ValueError(f"'{accuracy}' is not a valid value of 'accuracy' (must be either 'integrate' or 'leadinglog').")
+            raise ValueError(f"'{accuracy}' is not a valid value of 'accuracy' (must be one of 'integrate', 'implicit', 'linear', 'exponential', 'taylor', 'leadinglog', or 'auto').")
         return self._to_wcxf(C_out, scale)
 
+    def run_many(self, scales, accuracy='integrate', resume=False, **kwargs):
+        """Return the Wilson coefficients (as list of wcxf.WC instances)
+        evolved to each of the scales `scales`.
+
+        For accuracy='integrate' or 'implicit', the RGEs are integrated only
+        once (see `rge.smeft_evolve_many`) rather than once for every scale.
+        The other parameters and the attribute `run_info` are as in `run`.
+        """
+        if accuracy not in ('integrate', 'implicit') or kwargs.get('flavor_symmetry') is not None:
+            return [self.run(scale, accuracy=accuracy, resume=resume, **kwargs)
+                    for scale in scales]
+        if accuracy == 'implicit':
+            kwargs.setdefault('method', 'Radau')
+            if kwargs['method'] not in rge.IMPLICIT_METHODS:
+                raise ValueError(f"'{kwargs['method']}' is not an implicit ODE solver.")
+        kwargs.pop('flavor_symmetry', None)
+        self._check_initial()
+        t_start = perf_counter()
+        self.run_info = {'accuracy': accuracy, 'solver': None, 'timings': {}}
+        C_out = rge.smeft_evolve_many(C_in=self.C_in,
+                                      scale_in=self.scale_in,
+                                      scales_out=list(scales),
+                                      info=self.run_info,
+                                      **kwargs)
+        if resume:
+            self._get_checkpoints(**kwargs).update(zip(scales, C_out))
+        wcs_out = [self._to_wcxf(C, scale) for C, scale in zip(C_out, scales)]
+        self.run_info['timings']['total'] = perf_counter() - t_start
+        return wcs_out
+
     def run_continuous(self, scale):
         """Return a continuous solution to the RGE as `RGsolution` instance."""
         if scale == self.scale_in:
@@ -290,3 +518,40 @@ class SMEFT:
                                           scale_in=self.scale_in,
                                           scale_out=scale)
         return wilson.classes.RGsolution(fun, scale_min, scale_max)
+
+
+def run_batch(wc_list, scale, get_smpar=True, accuracy='integrate', **kwargs):
+    """Return the Wilson coefficients of several parameter points (as list
+    of wcxf.WC instances) evolved to the scale `scale`.
+
+    The RGEs of all points are solved simultaneously by a single numerical
+    integration, which is considerably faster than running the points
+    one by one.
+
+    Parameters:
+
+    - `wc_list`: list of `wcxf.WC` instances with common input scale
+    - `scale`: scale in GeV
+    - `get_smpar`: see `SMEFT._set_initial_wcxf`
+    - `accuracy`: 'integrate' (the default) or 'taylor' (see
+      `rge.smeft_evolve_taylor_batch`)
+
+    Additional keyword arguments will be passed to the ODE solver
+    `scipy.integrate.solve_ivp` or, for accuracy='taylor', to
+    `rge.smeft_evolve_taylor_batch`.
+    """
+    smefts = [SMEFT(wc, get_smpar=get_smpar) for wc in wc_list]
+    scales_in = {smeft.scale_in for smeft in smefts}
+    if len(scales_in) != 1:
+        raise ValueError("All Wilson coefficients must have the same input scale.")
+    if accuracy == 'integrate':
+        evolve = rge.smeft_evolve_batch
+    elif accuracy == 'taylor':
+        evolve = rge.smeft_evolve_taylor_batch
+    else:
+        raise ValueError(f"'{accuracy}' is not a valid value of 'accuracy' (must be either 'integrate' or 'taylor').")
+    C_out = evolve(C_in=[smeft.C_in for smeft in smefts],
+                   scale_in=scales_in.pop(),
+                   scale_out=scale,
+                   **kwargs)
+    return [smeft._to_wcxf(C, scale) for smeft, C in zip(smefts, C_out)]
@@ -1,10 +1,13 @@
 """Solving the SMEFT RGEs."""
 
 
-from . import beta
+from . import beta, symmetry
 from copy import deepcopy
 from math import pi, log
-from scipy.integrate import solve_ivp
+from time import perf_counter
+from scipy.integrate import solve_ivp, OdeSolver, DenseOutput
+from scipy.linalg import block_diag
+import scipy.sparse
 from wilson.util import smeftutil
 import numpy as np
 
@@ -13,43 +16,672 @@ def smeft_evolve_leadinglog(C_in, scale_in, scale_out, newphys=True):
     """Solve the SMEFT RGEs in the leading log approximation.
 
     Input C_in and output C_out are dictionaries of arrays."""
-    C_out = deepcopy(C_in)
-    b = beta.beta(C_out, newphys=newphys)
-    for k, C in C_out.items():
-        C_out[k] = C + b[k] / (16 * pi**2) * log(scale_out / scale_in)
-    return C_out
+    b = beta.beta(C_in, newphys=newphys)
+    return {k: C + b[k] / (16 * pi**2) * log(scale_out / scale_in)
+            for k, C in C_in.items()}
+
+
+def smeft_evolve_leadinglog_error(C_in, scale_in, scale_out, newphys=True):
+    """Solve the SMEFT RGEs in the leading log approximation and estimate
+    its relative error.
+
+    The estimate is the difference between the leading log and the
+    trapezoidal approximation, which requires one additional evaluation of
+    the beta functions at `scale_out`, relative to the largest Wilson
+    coefficient.
+
+    Returns the dictionary of arrays C_out and the error estimate."""
+    b_in = beta.beta(C_in, newphys=newphys)
+    C_out = {k: C + b_in[k] / (16 * pi**2) * log(scale_out / scale_in)
+             for k, C in C_in.items()}
+    b_out = beta.beta(C_out, newphys=newphys)
+    error = max(np.max(np.abs(b_out[k] - b_in[k])) for k in smeftutil.WC_keys)
+    size = max(np.max(np.abs(C_out[k])) for k in smeftutil.WC_keys)
+    if size == 0:
+        return C_out, 0.
+    t = log(scale_out / scale_in) / (16 * pi**2)
+    return C_out, abs(t) / 2 * error / size
+
+
+def _taylor_array(Y0, t, order, newphys=True):
+    """Return the Taylor polynomial of order `order` of the solution to the
+    SMEFT RGEs at $t=\\log(\\mu_\\text{out}/\\mu_\\text{in})/(16\\pi^2)$
+    for the 2D array `Y0` of flat parameter arrays (one row per parameter
+    point).
+
+    The Taylor coefficients $c_k$ are determined recursively from
+    $(k+1) c_{k+1} = [s^k]\\,\\beta(p_k(s))$, where $p_k(s)=\\sum_{i\\le k} c_i s^i$.
+    The coefficient of $s^k$ is obtained from the values of the beta
+    functions at `order` Chebyshev nodes $s_j\\in[-|t|, |t|]$ along the curve
+    $p_k$, i.e. from directional derivatives along the truncated solution,
+    which introduces an error of the same order as the truncation of the
+    Taylor series. All points and nodes are evaluated in a single call of the
+    beta functions for each order."""
+    if t == 0:
+        # the nodes would coincide
+        return Y0.copy()
+    c = [Y0, beta.beta_array(smeftutil.C_array2dict(Y0), newphys=newphys)]
+    if order > 1:
+        nodes = abs(t) * np.cos(np.pi * (np.arange(order) + 0.5) / order)
+        V = np.vander(nodes, increasing=True)
+        Y = np.empty((order,) + Y0.shape, dtype=complex)
+        dY = np.empty((order * len(Y0), Y0.shape[1]), dtype=complex)
+    for k in range(1, order):
+        # values of the Taylor polynomial of order k at the nodes
+        Y[:] = c[k]
+        for ck in c[k - 1::-1]:
+            Y *= nodes[:, None, None]
+            Y += ck
+        beta.beta_array(smeftutil.C_array2dict(Y.reshape(dY.shape)),
+                        newphys=newphys, out=dY)
+        a = np.linalg.solve(V, dY.reshape(order, -1))
+        c.append(a[k].reshape(Y0.shape) / (k + 1))
+    y = c[-1] * t
+    for ck in c[-2:0:-1]:
+        y += ck
+        y *= t
+    return y + Y0
+
+
+def smeft_evolve_taylor(C_in, scale_in, scale_out, order=2, newphys=True):
+    """Solve the SMEFT RGEs by expanding the solution in a Taylor series in
+    $\\log\\mu$ up to the order `order` (1 corresponds to the leading log
+    approximation), see `_taylor_array`.
+
+    Input C_in and output C_out are dictionaries of arrays."""
+    Y0 = smeftutil.C_dict2array(C_in).astype(complex)[None]
+    t = log(scale_out / scale_in) / (16 * pi**2)
+    Y = _taylor_array(Y0, t, order, newphys=newphys)
+    return smeftutil.C_array2dict(Y[0])
+
+
+def smeft_evolve_taylor_batch(C_in, scale_in, scale_out, order=2,
+                              newphys=True):
+    """Solve the SMEFT RGEs for several parameter points like
+    `smeft_evolve_taylor`, evaluating the beta functions for all points at
+    once.
+
+    Input C_in and output C_out are lists of dictionaries of arrays."""
+    Y0 = np.array([smeftutil.C_dict2array(C) for C in C_in], dtype=complex)
+    t = log(scale_out / scale_in) / (16 * pi**2)
+    Y = _taylor_array(Y0, t, order, newphys=newphys)
+    return [smeftutil.C_array2dict(y) for y in Y]
+
+
+# ODE solvers that make use of the Jacobian of the beta functions
+IMPLICIT_METHODS = ('Radau', 'BDF', 'LSODA')
+
+
+class RK4(OdeSolver):
+    """Classical Runge-Kutta method of order 4 with fixed step size.
+
+    The integration interval is divided into `steps` steps of equal length,
+    such that the number of evaluations of the right-hand side (4 per step)
+    does not depend on the solution. Tolerances passed as keyword arguments
+    are ignored. The dense output is given by cubic Hermite interpolation."""
+
+    def __init__(self, fun, t0, y0, t_bound, vectorized=False, steps=4,
+                 **extraneous):
+        super().__init__(fun, t0, y0, t_bound, vectorized)
+        self.t0 = t0
+        self.steps = steps
+        self.h = (t_bound - t0) / steps
+        self.n_steps = 0
+        self.f = self.fun(self.t, self.y)
+        self.t_old = self.y_old = self.f_old = None
+
+    def _step_impl(self):
+        t, y, h, f = self.t, self.y, self.h, self.f
+        k2 = self.fun(t + h / 2, y + h / 2 * f)
+        k3 = self.fun(t + h / 2, y + h / 2 * k2)
+        k4 = self.fun(t + h, y + h * k3)
+        self.n_steps += 1
+        # avoid the accumulation of rounding errors in t
+        t_new = self.t_bound if self.n_steps == self.steps else self.t0 + self.n_steps * h
+        self.t_old, self.y_old, self.f_old = t, y, f
+        self.t = t_new
+        self.y = y + h / 6 * (f + 2 * k2 + 2 * k3 + k4)
+        self.f = self.fun(self.t, self.y)
+        return True, None
+
+    def _dense_output_impl(self):
+        return _HermiteDenseOutput(self.t_old, self.t, self.y_old, self.y,
+                                   self.f_old, self.f)
+
 
+class _HermiteDenseOutput(DenseOutput):
+    """Cubic Hermite interpolation between two points of a solution."""
 
-def _smeft_evolve(C_in, scale_in, scale_out, newphys=True, **kwargs):
-    """Axuliary function used in `smeft_evolve` and `smeft_evolve_continuous`"""
+    def __init__(self, t_old, t, y_old, y, f_old, f):
+        super().__init__(t_old, t)
+        self.h = t - t_old
+        self.y_old, self.y = y_old, y
+        self.f_old, self.f = f_old, f
+
+    def _call_impl(self, t):
+        x = (np.asarray(t) - self.t_old) / self.h
+        h00 = (1 + 2 * x) * (1 - x)**2
+        h10 = x * (1 - x)**2
+        h01 = x**2 * (3 - 2 * x)
+        h11 = x**2 * (x - 1)
+        y = (np.multiply.outer(self.y_old, h00)
+             + np.multiply.outer(self.h * self.f_old, h10)
+             + np.multiply.outer(self.y, h01)
+             + np.multiply.outer(self.h * self.f, h11))
+        return y
+
+
+# ODE solvers with fixed step size in addition to the ones of `solve_ivp`
+FIXED_STEP_METHODS = {'RK4': RK4}
+
+
+def _solve_ivp(fun, t_span, y0, **kwargs):
+    """Call `scipy.integrate.solve_ivp`, additionally accepting the names of
+    the methods in `FIXED_STEP_METHODS` with the number of steps as keyword
+    argument `steps`."""
+    method = kwargs.get('method')
+    if isinstance(method, str) and method in FIXED_STEP_METHODS:
+        kwargs['method'] = FIXED_STEP_METHODS[method]
+    return solve_ivp(fun=fun, t_span=t_span, y0=y0, **kwargs)
+
+
+def _active_indices(C_in, newphys=True):
+    """Return the names of the parameters that can be nonzero in the RG
+    evolution of `C_in` and the indices of their entries in the flat array
+    of parameters.
+
+    These are the SM parameters and the closure under mixing of the Wilson
+    coefficients that are nonzero in `C_in`."""
+    keys = set(smeftutil.dim4_keys)
+    if newphys:
+        nonzero = [k for k in smeftutil.WC_keys if np.any(C_in[k] != 0)]
+        keys |= beta.mixing_closure(nonzero)
+    idx = np.arange(smeftutil.C_size)
+    idx = np.hstack([np.atleast_1d(idx[smeftutil.C_slices[k]])
+                     for k in smeftutil.C_keys if k in keys])
+    return keys, idx
+
+
+def _state_layout(y_full, idx):
+    """Return the indices of the entries of the real representation of the
+    flat parameter array `y_full` forming the ODE state and the sparse matrix
+    mapping the state back to these entries, given the indices `idx` of the
+    active parameters.
+
+    If the parameters have the symmetries of the Wilson coefficients, only
+    the independent real components are kept (see
+    `smeftutil.C_array2packed`), except for the Wilson coefficients whose
+    beta functions do not have these symmetries (see
+    `beta.nonsymmetric_keys`). Otherwise, all real components of the active
+    parameters are kept."""
+    indices, M = smeftutil._get_packing()
+    x = smeftutil.C_array2packed(y_full)
+    if np.allclose(smeftutil.C_packed2array(x), y_full, rtol=1e-14, atol=0):
+        nonsymmetric = np.zeros(len(y_full), dtype=bool)
+        for k in beta.nonsymmetric_keys():
+            nonsymmetric[smeftutil.C_slices[k]] = True
+        active = np.isin(indices // 2, idx[~nonsymmetric[idx]])
+        indices, M = indices[active], M[:, active]
+        idx = idx[nonsymmetric[idx]]
+    else:
+        indices, M = indices[:0], M[:, :0]
+    indices_full = np.ravel(np.column_stack([2 * idx, 2 * idx + 1]))
+    M_full = scipy.sparse.csr_matrix((np.ones(len(indices_full)),
+                                      (indices_full, np.arange(len(indices_full)))),
+                                     shape=(2 * len(y_full), len(indices_full)))
+    return (np.concatenate([indices, indices_full]),
+            scipy.sparse.hstack([M, M_full], format='csr'))
+
+
+def _update_info(info, sol, timings):
+    """Add the statistics of the ODE solution `sol` and the `timings` (in
+    seconds) to the dictionary `info`, accumulating over several
+    integrations."""
+    solver = info.get('solver') or {'nfev': 0, 'njev': 0, 'nlu': 0,
+                                    'steps': 0, 'status': 0, 'message': ''}
+    for k in ['nfev', 'njev', 'nlu']:
+        solver[k] += getattr(sol, k)
+    # without `t_eval`, the solution contains all steps
+    solver['steps'] += len(sol.t) - 1 if timings.pop('all_steps') else 0
+    solver['status'] = min(solver['status'], sol.status)
+    solver['message'] = sol.message
+    info['solver'] = solver
+    info_timings = info.setdefault('timings', {})
+    for k, v in timings.items():
+        info_timings[k] = info_timings.get(k, 0) + v
+
+
+# cache of the columns of the Jacobian along the Wilson coefficients, see
+# `_smeft_evolve`
+_jacobian_cache = {}
+_JACOBIAN_CACHE_SIZE = 8
+
+
+def _smeft_evolve(C_in, scale_in, scale_out, newphys=True, info=None,
+                  **kwargs):
+    """Axuliary function used in `smeft_evolve` and `smeft_evolve_continuous`
+
+    Only the parameters that can be nonzero are integrated and only their
+    independent real components are kept in the ODE state (see
+    `_state_layout`). Returns the solution object and a function mapping
+    the (reduced) solution vector to the flat complex array of all
+    parameters.
+
+    If `info` is a dictionary, the statistics of the ODE solver (key
+    'solver': number of evaluations of the beta functions 'nfev' and the
+    Jacobian 'njev', of LU decompositions 'nlu', of steps 'steps', and the
+    final 'status' and 'message' of `solve_ivp`) and the time spent in the
+    beta functions, in the Jacobian and in packing and unpacking the ODE
+    state (key 'timings') are added to it."""
+    timings = {'beta': 0., 'jacobian': 0., 'packing': 0.,
+               'all_steps': 't_eval' not in kwargs}
+    t_start = perf_counter()
+    y_full = smeftutil.C_dict2array(C_in).astype(complex)
+    keys, idx = _active_indices(C_in, newphys=newphys)
+    gather, scatter = _state_layout(y_full, idx)
+    # real representation of the parameters not contained in the state
+    y_fixed = y_full.view(float).copy()
+    y_fixed[np.unique(scatter.nonzero()[0])] = 0
+    y_real = y_full.view(float)
+    timings['packing'] += perf_counter() - t_start
+    # preallocated buffer for the beta functions; the dictionary passed to
+    # `beta.beta` only contains views of the state vector. Beta functions
+    # of inactive Wilson coefficients are not computed and stay zero.
+    dy = np.zeros(smeftutil.C_size, dtype=complex)
     def fun(t0, y):
-        return beta.beta_array(C=smeftutil.C_array2dict(y.view(complex)),
-                               newphys=newphys).view(float) / (16 * pi**2)
-    y0 = smeftutil.C_dict2array(C_in).view(float)
-    sol = solve_ivp(fun=fun,
+        t_0 = perf_counter()
+        y_real[:] = y_fixed + scatter @ y
+        t_1 = perf_counter()
+        beta.beta_array(C=smeftutil.C_array2dict(y_full),
+                        newphys=newphys, keys=keys, out=dy)
+        t_2 = perf_counter()
+        dy_state = dy.view(float)[gather] / (16 * pi**2)
+        timings['beta'] += t_2 - t_1
+        timings['packing'] += perf_counter() - t_2 + t_1 - t_0
+        return dy_state
+    method = kwargs.get('method')
+    if method in IMPLICIT_METHODS and 'jac' not in kwargs:
+        # The columns along the Wilson coefficients only depend on the SM
+        # parameters, which vary slowly with the scale. They are computed
+        # at the input scale and reused in all steps (and in integrations
+        # with the same SM parameters and state), since the Jacobian only
+        # enters the Newton iterations of the implicit methods and not the
+        # solution. Only the columns along the SM parameters are updated.
+        n_sm = sum(np.size(C_in[k]) for k in smeftutil.dim4_keys)
+        key = (y_full[:n_sm].tobytes(), newphys, gather.tobytes())
+        def jac(t0, y):
+            t_0 = perf_counter()
+            y_real[:] = y_fixed + scatter @ y
+            C = smeftutil.C_array2dict(y_full)
+            if key not in _jacobian_cache:
+                if len(_jacobian_cache) >= _JACOBIAN_CACHE_SIZE:
+                    del _jacobian_cache[next(iter(_jacobian_cache))]
+                _jacobian_cache[key] = beta.beta_jacobian(
+                    C, newphys=newphys, directions=scatter, keys=keys,
+                    columns='wc').tocsr()[gather]
+            J_sm = beta.beta_jacobian(C, newphys=newphys, directions=scatter,
+                                      keys=keys, columns='sm').tocsr()[gather]
+            J = (J_sm + _jacobian_cache[key]) / (16 * pi**2)
+            if method == 'LSODA':  # LSODA does not support sparse matrices
+                J = J.toarray()
+            timings['jacobian'] += perf_counter() - t_0
+            return J
+        kwargs['jac'] = jac
+    y0 = y_real[gather]
+    sol = _solve_ivp(fun=fun,
                     t_span=(log(scale_in), log(scale_out)),
                     y0=y0, **kwargs)
-    return sol
+    if info is not None:
+        _update_info(info, sol, timings)
+    def to_full(y):
+        return (y_fixed + scatter @ y).view(complex)
+    return sol, to_full
+
+
+# cache of SM trajectories, see `smeft_evolve_sm`
+_sm_cache = {}
+_SM_CACHE_SIZE = 32
 
 
-def smeft_evolve(C_in, scale_in, scale_out, newphys=True, **kwargs):
+def smeft_evolve_sm(C_in, scale_in, scale_out, **kwargs):
+    """Solve the RGEs of the SM parameters by numeric integration, keeping
+    the Wilson coefficients fixed at their input values.
+
+    The continuous solutions are cached for given input values and ODE
+    solver options and are reused for all output scales within their
+    range.
+
+    Input C_in and output C_out are dictionaries of arrays."""
+    if scale_out == scale_in:
+        return deepcopy(C_in)
+    y_full = smeftutil.C_dict2array(C_in).astype(complex)
+    # the SM parameters are the first entries of the flat array
+    n_sm = sum(np.size(C_in[k]) for k in smeftutil.dim4_keys)
+    y0 = y_full[:n_sm].copy()
+    key = (scale_in, scale_out > scale_in, y0.tobytes(),
+           np.hstack([np.ravel(C_in[k]) for k in beta.SM_BETA_KEYS]).tobytes(),
+           repr(sorted(kwargs.items())))
+    t_in, t_out = log(scale_in), log(scale_out)
+    sol = _sm_cache.get(key)
+    if sol is None or not sol.t_min <= t_out <= sol.t_max:
+        dy = np.zeros(smeftutil.C_size, dtype=complex)
+        def fun(t0, y):
+            y_full[:n_sm] = y.view(complex)
+            beta.beta_array(C=smeftutil.C_array2dict(y_full),
+                            keys=smeftutil.dim4_keys, out=dy)
+            return dy[:n_sm].view(float) / (16 * pi**2)
+        if sol is not None:
+            # extend the range of the cached solution
+            t_out = max(t_out, sol.t_min, sol.t_max,
+                        key=lambda t: abs(t - t_in))
+        res = _solve_ivp(fun=fun, t_span=(t_in, t_out), y0=y0.view(float),
+                        dense_output=True, **kwargs)
+        if not res.success:
+            # do not cache failed integrations but return the last point
+            y_full[:n_sm] = res.y[:, -1].view(complex)
+            return smeftutil.C_array2dict(y_full)
+        sol = res.sol
+        if key not in _sm_cache and len(_sm_cache) >= _SM_CACHE_SIZE:
+            del _sm_cache[next(iter(_sm_cache))]
+        _sm_cache[key] = sol
+    y_full[:n_sm] = sol(log(scale_out)).view(complex)
+    return smeftutil.C_array2dict(y_full)
+
+
+# cache for the linearized evolution, see `smeft_evolve_linear`
+_linear_cache = {}
+_LINEAR_CACHE_SIZE = 32
+
+
+def _smeft_evolve_linear_sm(y_sm, scale_in, scale_out, **kwargs):
+    """Solve the SM RGEs for vanishing Wilson coefficients.
+
+    `y_sm` is the flat complex array of SM parameters at `scale_in`. Returns
+    the continuous solution as function of $\log\mu$ (returning the real
+    representation of the array of SM parameters)."""
+    n_sm = len(y_sm)
+    y_full = np.zeros(smeftutil.C_size, dtype=complex)
+    dy = np.zeros(smeftutil.C_size, dtype=complex)
+    def fun(t0, y):
+        y_full[:n_sm] = y.view(complex)
+        beta.beta_array(C=smeftutil.C_array2dict(y_full),
+                        keys=smeftutil.dim4_keys, out=dy)
+        return dy[:n_sm].view(float) / (16 * pi**2)
+    sol = _solve_ivp(fun=fun,
+                     t_span=(log(scale_in), log(scale_out)),
+                     y0=np.ascontiguousarray(y_sm).view(float),
+                     dense_output=True, **kwargs)
+    return sol.sol
+
+
+def _smeft_evolve_linear_columns(sm, n_sm, cols, scale_in, scale_out, **kwargs):
+    """Solve the linearized RGEs of the dimension-six Wilson coefficients
+    along the SM trajectory `sm` (see `_smeft_evolve_linear_sm`) for unit
+    initial conditions.
+
+    `n_sm` is the number of (complex) SM parameters and `cols` the indices
+    of the unit initial conditions in the real representation of the flat
+    array of Wilson coefficients. Returns a 2D array containing the Wilson
+    coefficients at `scale_out` for each of the initial conditions."""
+    k = len(cols)
+    V0 = np.zeros((k, smeftutil.C_size - n_sm), dtype=complex)
+    V0[np.arange(k), cols // 2] = np.where(cols % 2, 1j, 1)
+    # batch of parameter points sharing the SM parameters
+    Y = np.zeros((k, smeftutil.C_size), dtype=complex)
+    dY = np.empty_like(Y)
+    def fun(t0, v):
+        Y[:, :n_sm] = sm(t0).view(complex)
+        Y[:, n_sm:] = v.view(complex).reshape(V0.shape)
+        beta.beta_array(C=smeftutil.C_array2dict(Y), out=dY)
+        return dY[:, n_sm:].ravel().view(float) / (16 * pi**2)
+    sol = _solve_ivp(fun=fun,
+                     t_span=(log(scale_in), log(scale_out)),
+                     y0=V0.ravel().view(float), **kwargs)
+    return sol.y[:, -1].view(complex).reshape(V0.shape)
+
+
+def smeft_evolve_linear(C_in, scale_in, scale_out, **kwargs):
+    """Solve the SMEFT RGEs to linear order in the dimension-six Wilson
+    coefficients, i.e. running the SM parameters without the contributions
+    of the Wilson coefficients and the Wilson coefficients with the
+    anomalous dimension matrix along this SM trajectory.
+
+    The SM trajectory is computed once for given scales, SM parameters at
+    `scale_in` and solver options. The columns of the evolution matrix are
+    computed by numerical integration along this trajectory when needed for
+    the first time and are cached, such that subsequent calls only require
+    a matrix-vector product.
+
+    Input C_in and output C_out are dictionaries of arrays."""
+    y = smeftutil.C_dict2array(C_in).astype(complex)
+    n_sm = sum(np.size(C_in[k]) for k in smeftutil.dim4_keys)
+    y_sm = y[:n_sm]
+    x = y[n_sm:].view(float)
+    cols = np.flatnonzero(x)
+    key = (scale_in, scale_out, y_sm.tobytes(), tuple(sorted(kwargs.items())))
+    if key not in _linear_cache:
+        if len(_linear_cache) >= _LINEAR_CACHE_SIZE:
+            del _linear_cache[next(iter(_linear_cache))]
+        sm = _smeft_evolve_linear_sm(y_sm, scale_in, scale_out, **kwargs)
+        _linear_cache[key] = {'sm': sm,
+                              'sm_out': sm(log(scale_out)).view(complex),
+                              'columns': {}}
+    cache = _linear_cache[key]
+    missing = np.array([j for j in cols if j not in cache['columns']],
+                       dtype=int)
+    if len(missing):
+        V = _smeft_evolve_linear_columns(cache['sm'], n_sm, missing,
+                                         scale_in, scale_out, **kwargs)
+        cache['columns'].update(zip(missing, V))
+    y_out = np.zeros_like(y)
+    y_out[:n_sm] = cache['sm_out']
+    if len(cols):
+        U = np.array([cache['columns'][j] for j in cols]).T
+        y_out[n_sm:] = U @ x[cols]
+    return smeftutil.C_array2dict(y_out)
+
+
+def _expm_apply(A, x, tol=1e-12, max_terms=50):
+    """Return $\\exp(A) x$ for a linear map `A` (a function acting on
+    arrays) by summing the Taylor series until the terms are negligible."""
+    result = x.copy()
+    term = x
+    norm = np.linalg.norm(x)
+    for n in range(1, max_terms + 1):
+        term = A(term) / n
+        result += term
+        if np.linalg.norm(term) <= tol * norm:
+            break
+    return result
+
+
+def smeft_evolve_exponential(C_in, scale_in, scale_out, newphys=True,
+                             segments=5, **kwargs):
+    """Solve the SMEFT RGEs piecewise exponentially.
+
+    The range of $\\log\\mu$ is divided into `segments` segments of equal
+    length. On each segment, the SM parameters are frozen to their values
+    at the midpoint of the segment and the dimension-six Wilson coefficients
+    are evolved with the exponential of the anomalous dimension matrix
+    evaluated there, as done in `wilson.run.wet.rge.getUs` for the WET. The
+    error decreases quadratically with the number of segments.
+
+    The SM parameters are taken from the (cached) numerical solution of
+    their RGEs for fixed Wilson coefficients, see `smeft_evolve_sm`, to which
+    additional keyword arguments are passed. Since the anomalous dimension
+    matrix of all Wilson coefficients is large, the exponential is not
+    computed explicitly but applied to the Wilson coefficients by summing
+    its Taylor series, which requires one evaluation of the beta functions
+    per term (typically 6 to 7 per segment). This is not faster than
+    `smeft_evolve` with the default tolerances, which typically requires
+    about 15 evaluations, but the cost is essentially fixed by `segments`
+    and the accuracy can be controlled with it.
+
+    Input C_in and output C_out are dictionaries of arrays."""
+    y = smeftutil.C_dict2array(C_in).astype(complex)
+    n_sm = sum(np.size(C_in[k]) for k in smeftutil.dim4_keys)
+    # make sure the cached SM trajectory covers the whole range
+    y_sm_out = smeftutil.C_dict2array(
+        smeft_evolve_sm(C_in, scale_in, scale_out, **kwargs))[:n_sm]
+    if newphys:
+        keys, _ = _active_indices(C_in, newphys=newphys)
+        h = log(scale_out / scale_in) / segments
+        Y = np.empty_like(y)
+        # inactive beta functions are not computed and stay zero
+        dy = np.zeros_like(y)
+        def A(x):
+            Y[n_sm:] = x
+            beta.beta_array(smeftutil.C_array2dict(Y), keys=keys, out=dy)
+            return h / (16 * pi**2) * dy[n_sm:]
+        for i in range(segments):
+            scale_mid = scale_in * np.exp((i + 0.5) * h)
+            C_mid = smeft_evolve_sm(C_in, scale_in, scale_mid, **kwargs)
+            Y[:n_sm] = smeftutil.C_dict2array(C_mid)[:n_sm]
+            y[n_sm:] = _expm_apply(A, y[n_sm:])
+    y[:n_sm] = y_sm_out
+    return smeftutil.C_array2dict(y)
+
+
+def smeft_evolve(C_in, scale_in, scale_out, newphys=True, info=None,
+                 **kwargs):
     """Solve the SMEFT RGEs by numeric integration.
 
+    Additional keyword arguments are passed to `scipy.integrate.solve_ivp`,
+    which additionally accepts the fixed-step methods in
+    `FIXED_STEP_METHODS`, e.g. `method='RK4', steps=4`. If `info` is a
+    dictionary, solver statistics and timings are added to it (see
+    `_smeft_evolve`).
+
     Input C_in and output C_out are dictionaries of arrays."""
-    sol = _smeft_evolve(C_in, scale_in, scale_out, newphys=newphys, **kwargs)
-    return smeftutil.C_array2dict(sol.y[:, -1].view(complex))
+    sol, to_full = _smeft_evolve(C_in, scale_in, scale_out, newphys=newphys,
+                                 info=info, **kwargs)
+    return smeftutil.C_array2dict(to_full(sol.y[:, -1]))
+
+
+def smeft_evolve_many(C_in, scale_in, scales_out, newphys=True, info=None,
+                      **kwargs):
+    """Solve the SMEFT RGEs by numeric integration for several output
+    scales.
+
+    The RGEs are integrated only once in each direction, evaluating the
+    solution at all the output scales.
+
+    If `info` is a dictionary, solver statistics and timings (summed over
+    both directions) are added to it (see `_smeft_evolve`).
+
+    Input C_in is a dictionary of arrays, the output is a list of
+    dictionaries of arrays (one for each element of `scales_out`)."""
+    C_out = [None] * len(scales_out)
+    for sign in (-1, 1):
+        # distinct output scales below (above) the input scale
+        scales = sorted({scale for scale in scales_out
+                         if sign * (scale - scale_in) > 0},
+                        key=lambda scale: sign * scale)
+        if not scales:
+            continue
+        sol, to_full = _smeft_evolve(C_in, scale_in, scales[-1],
+                                     newphys=newphys, info=info,
+                                     t_eval=[log(scale) for scale in scales],
+                                     **kwargs)
+        if not sol.success or len(sol.t) != len(scales):
+            raise RuntimeError("The integration of the SMEFT RGEs stopped "
+                               "before reaching all output scales: "
+                               f"{sol.message}")
+        solutions = {scale: y for scale, y in zip(scales, sol.y.T)}
+        for i, scale in enumerate(scales_out):
+            if scale in solutions:
+                C_out[i] = smeftutil.C_array2dict(to_full(solutions[scale]))
+    for i, scale in enumerate(scales_out):
+        if scale == scale_in:
+            C_out[i] = deepcopy(C_in)
+    return C_out
+
+
+def smeft_evolve_symmetric(C_in, scale_in, scale_out, flavor_symmetry,
+                           newphys=True, info=None, **kwargs):
+    """Solve the SMEFT RGEs by numeric integration for the Wilson
+    coefficients invariant under the flavor symmetry `flavor_symmetry` (see
+    `symmetry.invariant_basis`).
+
+    The components of the input Wilson coefficients that are not invariant
+    are discarded and the beta functions of the invariant coefficients are
+    obtained by projecting the full beta functions onto the invariant
+    subspace. This is exact if the SM Yukawa couplings respect the
+    symmetry and neglects the symmetry breaking by the Yukawa couplings
+    otherwise. Only the beta functions of the Wilson coefficients with
+    invariant components are computed.
+
+    If `info` is a dictionary, solver statistics and timings are added to
+    it (see `_smeft_evolve`).
+
+    Input C_in and output C_out are dictionaries of arrays."""
+    timings = {'beta': 0., 'packing': 0., 'all_steps': 't_eval' not in kwargs}
+    basis = symmetry.invariant_basis(flavor_symmetry, C_in)
+    keys = set(smeftutil.dim4_keys)
+    keys |= {k for k in smeftutil.WC_keys if basis[k].shape[1]}
+    indices = np.arange(smeftutil.C_size)
+    idx = {k: np.atleast_1d(indices[smeftutil.C_slices[k]])
+           for k in smeftutil.C_keys if k in keys}
+    idx_sm = np.hstack([idx[k] for k in smeftutil.dim4_keys])
+    idx_wc = np.hstack([idx[k] for k in smeftutil.WC_keys if k in keys])
+    P = block_diag(*[basis[k] for k in smeftutil.WC_keys if k in keys])
+    n_sm = 2 * len(idx_sm)
+    y_full = np.zeros(smeftutil.C_size, dtype=complex)
+    dy = np.zeros(smeftutil.C_size, dtype=complex)
+    def to_full(y):
+        y_full[idx_sm] = y[:n_sm].view(complex)
+        y_full[idx_wc] = (P @ y[n_sm:]).view(complex)
+        return y_full
+    def fun(t0, y):
+        t_0 = perf_counter()
+        C = smeftutil.C_array2dict(to_full(y))
+        t_1 = perf_counter()
+        beta.beta_array(C=C, newphys=newphys, keys=keys, out=dy)
+        t_2 = perf_counter()
+        dy_state = np.concatenate([dy[idx_sm].view(float),
+                                   P.T @ dy[idx_wc].view(float)]) / (16 * pi**2)
+        timings['beta'] += t_2 - t_1
+        timings['packing'] += perf_counter() - t_2 + t_1 - t_0
+        return dy_state
+    y0_full = smeftutil.C_dict2array(C_in).astype(complex)
+    y0 = np.concatenate([y0_full[idx_sm].view(float),
+                         P.T @ y0_full[idx_wc].view(float)])
+    sol = _solve_ivp(fun=fun,
+                    t_span=(log(scale_in), log(scale_out)),
+                    y0=y0, **kwargs)
+    if info is not None:
+        _update_info(info, sol, timings)
+    return smeftutil.C_array2dict(to_full(sol.y[:, -1]).copy())
+
+
+def smeft_evolve_batch(C_in, scale_in, scale_out, newphys=True, **kwargs):
+    """Solve the SMEFT RGEs for several parameter points by a single numeric
+    integration with common step size control.
+
+    Input C_in and output C_out are lists of dictionaries of arrays."""
+    Y0 = np.array([smeftutil.C_dict2array(C) for C in C_in], dtype=complex)
+    dY = np.empty_like(Y0)
+    def fun(t0, y):
+        Y = y.view(complex).reshape(Y0.shape)
+        beta.beta_array(C=smeftutil.C_array2dict(Y), newphys=newphys, out=dY)
+        return dY.view(float).ravel() / (16 * pi**2)
+    sol = _solve_ivp(fun=fun,
+                    t_span=(log(scale_in), log(scale_out)),
+                    y0=Y0.view(float).ravel(), **kwargs)
+    Y = sol.y[:, -1].view(complex).reshape(Y0.shape)
+    return [smeftutil.C_array2dict(y) for y in Y]
 
 
 def smeft_evolve_continuous(C_in, scale_in, scale_out, newphys=True, **kwargs):
     """Solve the SMEFT RGEs by numeric integration, returning a function that
     allows to compute an interpolated solution at arbitrary intermediate
     scales."""
-    sol = _smeft_evolve(C_in, scale_in, scale_out, newphys=newphys,
-                        dense_output=True, **kwargs)
+    sol, to_full = _smeft_evolve(C_in, scale_in, scale_out, newphys=newphys,
+                                 dense_output=True, **kwargs)
     @np.vectorize
     def _rge_solution(scale):
         t = log(scale)
-        y = sol.sol(t).view(complex)
+        y = to_full(sol.sol(t))
         yd = smeftutil.C_array2dict(y)
         yw = smeftutil.arrays2wcxf_nonred(yd)
         return yw
@@ -35,6 +35,12 @@ p['m_Z'] = 91.46
 p['m_h'] = 130.6
 
 
+# Wilson coefficients entering the relations between the SM parameters and
+# the physical masses and couplings
+SMEFTPAR_KEYS = ('phi', 'phiBox', 'phiD', 'phiW', 'phiB', 'phiWB', 'phiG',
+                 'uphi', 'dphi', 'ephi', 'll', 'phil3', 'llphiphi')
+
+
 def m2Lambda_to_vMh2(m2, Lambda, C):
     """Function to numerically determine the  physical Higgs VEV and mass
     given the parameters of the Higgs potential.
@@ -0,0 +1,128 @@
+"""Flavor symmetry assumptions for the SMEFT Wilson coefficients.
+
+The Wilson coefficients invariant under a flavor symmetry span a linear
+subspace of the space of all Wilson coefficients. The functions in this
+module determine an orthonormal basis of this subspace for each Wilson
+coefficient, which is used in `rge.smeft_evolve_symmetric` to solve the
+RGEs for the invariant coefficients only."""
+
+from functools import lru_cache
+import numpy as np
+from wilson.util import smeftutil
+from wilson.util.smeft_warsaw import flavor_rotation
+
+
+# Wilson coefficients aligned with the Yukawa couplings in MFV
+_MFV_KEYS = {
+    'Gu': ['uphi', 'uW', 'uB', 'uG'],
+    'Gd': ['dphi', 'dW', 'dB', 'dG'],
+    'Ge': ['ephi', 'eW', 'eB'],
+}
+
+FLAVOR_SYMMETRIES = ('U(3)^5', 'U(2)^5', 'MFV')
+
+
+def _random_unitary(n, rng):
+    """Random unitary $n\\times n$ matrix."""
+    Z = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+    Q, R = np.linalg.qr(Z)
+    return Q * (np.diag(R) / np.abs(np.diag(R)))
+
+
+def _random_rotation(flavor_symmetry, rng):
+    """Random element of the flavor symmetry group as dictionary of
+    rotation matrices of the five fermion fields."""
+    U = {}
+    for f in ['Uq', 'Uu', 'Ud', 'Ul', 'Ue']:
+        if flavor_symmetry == 'U(2)^5':
+            U[f] = np.eye(3, dtype=complex)
+            U[f][:2, :2] = _random_unitary(2, rng)
+        else:
+            U[f] = _random_unitary(3, rng)
+    return U
+
+
+def _real_matrices(linear_maps):
+    """Return, for each Wilson coefficient, the real matrices representing
+    the real-linear maps `linear_maps` (functions acting on dictionaries of
+    Wilson coefficient arrays with a leading batch axis) on the real and
+    imaginary parts of the coefficient."""
+    sizes = {k: int(np.prod(smeftutil.C_keys_shape[k])) for k in smeftutil.WC_keys}
+    indices = np.arange(smeftutil.C_size)
+    # unit vector j in all Wilson coefficients at once, for all j
+    Y = np.zeros((2 * max(sizes.values()), smeftutil.C_size), dtype=complex)
+    for k in smeftutil.WC_keys:
+        j = np.arange(2 * sizes[k])
+        idx = np.atleast_1d(indices[smeftutil.C_slices[k]])
+        Y[j, idx[j // 2]] = np.where(j % 2, 1j, 1)
+    C = smeftutil.C_array2dict(Y)
+    C = {k: C[k] for k in smeftutil.WC_keys}
+    M = {k: [] for k in smeftutil.WC_keys}
+    for f in linear_maps:
+        C_out = f(C)
+        for k in smeftutil.WC_keys:
+            n = 2 * sizes[k]
+            v = np.asarray(C_out[k][:n], dtype=complex).reshape(n, -1)
+            M[k].append(v.view(float).T)
+    return M
+
+
+def _symmetrize(C):
+    """`smeftutil.symmetrize` for Wilson coefficient arrays with a leading
+    batch axis."""
+    C = smeftutil.symmetrize({k: np.moveaxis(v, 0, -1) for k, v in C.items()})
+    return {k: np.moveaxis(v, -1, 0) for k, v in C.items()}
+
+
+@lru_cache(maxsize=None)
+def _invariant_basis(flavor_symmetry):
+    rng = np.random.default_rng(0)
+    # three generic group elements generate a dense subgroup
+    rotations = [_random_rotation(flavor_symmetry, rng) for _ in range(3)]
+    linear_maps = [_symmetrize]
+    linear_maps += [lambda C, U=U: flavor_rotation(C, **U) for U in rotations]
+    M = _real_matrices(linear_maps)
+    basis = {}
+    for k, Ms in M.items():
+        A = np.vstack([Mi - np.eye(len(Mi)) for Mi in Ms])
+        # A has more rows than columns, so Vh is complete without the
+        # full matrix of left singular vectors
+        _, s, Vh = np.linalg.svd(A, full_matrices=False)
+        rank = np.count_nonzero(s > 1e-8)
+        N = Vh[rank:].T
+        N[np.abs(N) < 1e-12] = 0  # remove numerical noise
+        basis[k] = N
+    return basis
+
+
+def invariant_basis(flavor_symmetry, C=None):
+    """Return a dictionary with the Wilson coefficient names as keys and,
+    as values, real arrays whose orthonormal columns span the subspace of
+    the real and imaginary parts (in the representation of
+    `np.ndarray.view(float)`) of the flattened, symmetrized Wilson
+    coefficient arrays that is invariant under the flavor symmetry.
+
+    Parameters:
+
+    - `flavor_symmetry`: one of 'U(3)^5' (flavor universality), 'U(2)^5'
+      (universality of the first two generations), or 'MFV' (leading order
+      minimal flavor violation: the $U(3)^5$ invariants plus the
+      chirality-flipping operators with the flavor structure of the Yukawa
+      couplings)
+    - `C`: dictionary containing the Yukawa couplings 'Gu', 'Gd', 'Ge',
+      only required for 'MFV'
+    """
+    if flavor_symmetry not in FLAVOR_SYMMETRIES:
+        raise ValueError(f"'{flavor_symmetry}' is not a valid flavor symmetry (must be one of {', '.join(FLAVOR_SYMMETRIES)}).")
+    if flavor_symmetry != 'MFV':
+        return _invariant_basis(flavor_symmetry).copy()
+    basis = _invariant_basis('U(3)^5').copy()
+    for G, keys in _MFV_KEYS.items():
+        y = np.ravel(np.asarray(C[G], dtype=complex))
+        if not np.any(y):
+            continue
+        y = y / np.linalg.norm(y)
+        N = np.column_stack([y.view(float), (1j * y).view(float)])
+        for k in keys:
+            basis[k] = N
+    return basis
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 import numpy.testing as npt
+import scipy.sparse
 from wilson.run.smeft import beta, rge
 from wilson.util import smeftutil
 import json
@@ -61,6 +62,152 @@ class TestBeta(unittest.TestCase):
         # shape is no. of op.s + no. of SM parameters
         self.assertEqual(my_beta.shape, (n_op + 5 + 3*9,))
 
+    def test_beta_array_out(self):
+        out = np.empty(smeftutil.C_size, dtype=complex)
+        my_beta = beta.beta_array(C, HIGHSCALE, out=out)
+        self.assertIs(my_beta, out)
+        npt.assert_array_equal(out, beta.beta_array(C, HIGHSCALE))
+
+    def test_beta_batch(self):
+        y = smeftutil.C_dict2array(C)
+        Y = np.array([y, 2 * y, 1j * y])
+        my_beta = beta.beta_array(smeftutil.C_array2dict(Y), HIGHSCALE)
+        self.assertEqual(my_beta.shape, Y.shape)
+        for i in range(len(Y)):
+            npt.assert_allclose(
+                my_beta[i],
+                beta.beta_array(smeftutil.C_array2dict(Y[i]), HIGHSCALE),
+                rtol=1e-12, atol=1e-12 * np.abs(my_beta[i]).max())
+
+    def test_beta_jacobian(self):
+        y = smeftutil.C_dict2array(C).view(float)
+        def f(x, newphys):
+            return beta.beta_array(smeftutil.C_array2dict(x.view(complex)),
+                                   HIGHSCALE, newphys=newphys).view(float)
+        # directions along a few SM parameters and Wilson coefficients
+        sm_keys = ['g', 'Lambda', 'Gu']
+        wc_keys = ['phi', 'uphi', 'qd1']
+        indices = np.arange(len(y)).reshape(-1, 2)
+        cols = np.hstack([np.ravel(indices[smeftutil.C_slices[k]])
+                          for k in sm_keys + wc_keys])
+        n_sm = 2 * sum(np.size(C[k]) for k in sm_keys)
+        directions = scipy.sparse.csc_matrix(
+            (np.ones(len(cols)), (cols, np.arange(len(cols)))),
+            shape=(len(y), len(cols)))
+        keys = beta.mixing_closure(['qd1'])
+        rows = np.zeros(len(y), dtype=bool)
+        for k in set(smeftutil.dim4_keys) | keys:
+            rows[indices[smeftutil.C_slices[k]]] = True
+        rng = np.random.default_rng(42)
+        for newphys in (True, False):
+            J_sm = beta.beta_jacobian(C, HIGHSCALE, newphys=newphys,
+                                      directions=directions, columns='sm')
+            J_wc = beta.beta_jacobian(C, HIGHSCALE, newphys=newphys,
+                                      directions=directions, columns='wc')
+            self.assertEqual(J_sm.shape, (len(y), len(cols)))
+            self.assertEqual(abs(J_sm[:, n_sm:]).max(), 0)
+            self.assertEqual(abs(J_wc[:, :n_sm]).max(), 0)
+            J = J_sm + J_wc
+            # check the columns of the SM parameters and of the Wilson
+            # coefficients separately, as the latter are much smaller; as the
+            # beta functions are linear in the latter, large steps are exact
+            for sl, step in ((slice(None, n_sm), 1e-6), (slice(n_sm, None), 1)):
+                dx = np.zeros(len(cols))
+                dx[sl] = (step * rng.standard_normal(len(cols))[sl]
+                          * np.maximum(np.abs(y[cols][sl]), 1e-3))
+                dy = directions @ dx
+                df = (f(y + dy, newphys) - f(y - dy, newphys)) / 2
+                self.assertGreater(np.abs(df).max(), 0)
+                npt.assert_allclose(J @ dx, df, rtol=0, atol=1e-6 * np.abs(df).max())
+        # restricting the rows
+        J_keys = beta.beta_jacobian(C, HIGHSCALE, newphys=False,
+                                    directions=directions, keys=keys,
+                                    columns='wc')
+        npt.assert_array_equal(J_keys.toarray()[rows], J_wc.toarray()[rows])
+        self.assertEqual(abs(J_keys[~rows]).max(), 0)
+
+    def test_einsum_cache(self):
+        beta.einsum_cache_clear()
+        self.assertEqual(beta.einsum_cache_info(), (0, 0, 0))
+        beta.beta(C, HIGHSCALE)
+        info = beta.einsum_cache_info()
+        self.assertGreater(info.misses, 0)
+        self.assertEqual(info.misses, info.currsize)
+        # changing the values does not require new contraction plans
+        C2 = {k: 2 * v for k, v in C.items()}
+        beta.beta(C2, HIGHSCALE)
+        info2 = beta.einsum_cache_info()
+        self.assertEqual(info2.misses, info.misses)
+        self.assertEqual(info2.hits, 2 * info.hits + info.misses)
+
+    def test_beta_keys(self):
+        keys = {'phi', 'uphi', 'qq1'} | set(smeftutil.dim4_keys)
+        b = beta.beta(C, HIGHSCALE)
+        b_keys = beta.beta(C, HIGHSCALE, keys=keys)
+        self.assertEqual(set(b_keys), keys)
+        for k in keys:
+            npt.assert_array_equal(b_keys[k], b[k])
+
+    def test_nonsymmetric_keys(self):
+        self.assertEqual(beta.nonsymmetric_keys(), {'ee', 'qqql'})
+
+    def test_mixing_closure(self):
+        self.assertEqual(beta.mixing_closure(['duql']),
+                         {'duql', 'duue', 'qqql', 'qque'})
+        closure = beta.mixing_closure(['qq1'])
+        self.assertIn('qq3', closure)
+        self.assertNotIn('duql', closure)
+        # Wilson coefficients outside of the closure are not generated
+        C_in = {k: np.zeros_like(v) for k, v in C.items()}
+        for k in smeftutil.dim4_keys:
+            C_in[k] = C[k]
+        C_in['duql'] = C['duql']
+        C_out = rge.smeft_evolve(C_in, 1000, 900)
+        for k in smeftutil.WC_keys:
+            if k not in {'duql', 'duue', 'qqql', 'qque'}:
+                self.assertEqual(np.count_nonzero(C_out[k]), 0)
+        self.assertNotEqual(np.count_nonzero(C_out['duue']), 0)
+
+    def test_beta_sm(self):
+        def n_einsum(f, *args):
+            info = beta.einsum_cache_info()
+            result = f(*args)
+            info_2 = beta.einsum_cache_info()
+            return result, info_2.hits + info_2.misses - info.hits - info.misses
+        b, n = n_einsum(beta.beta, C, HIGHSCALE)
+        b_sm, n_sm = n_einsum(beta.beta_sm, C, HIGHSCALE)
+        # the contractions of the beta functions of the Wilson coefficients
+        # are skipped
+        self.assertLess(n_sm, n / 50)
+        self.assertEqual(set(b_sm), set(smeftutil.dim4_keys))
+        for k in smeftutil.dim4_keys:
+            npt.assert_array_equal(b_sm[k], b[k])
+        # Wilson coefficients not in SM_BETA_KEYS are not needed
+        C_sm = {k: C[k] for k in list(smeftutil.dim4_keys) + list(beta.SM_BETA_KEYS)}
+        C_sm.update({k: 2 * v for k, v in C_sm.items()
+                     if k in beta.SM_BETA_KEYS})
+        C_2 = {k: 2 * v for k, v in C.items()}
+        C_2.update({k: C[k] for k in smeftutil.dim4_keys})
+        b_sm_2 = beta.beta_sm(C_sm, HIGHSCALE)
+        b_2 = beta.beta(C_2, HIGHSCALE)
+        for k in smeftutil.dim4_keys:
+            npt.assert_allclose(b_sm_2[k], b_2[k], rtol=1e-12)
+
+    def test_evolve_sm(self):
+        C_in = C
+        kwargs = dict(rtol=1e-8, atol=1e-10)
+        C_out = rge.smeft_evolve(C_in, 1000, 500, newphys=False, **kwargs)
+        C_out_sm = rge.smeft_evolve_sm(C_in, 1000, 500, **kwargs)
+        for k in smeftutil.C_keys:
+            npt.assert_allclose(C_out_sm[k], C_out[k], rtol=1e-12, atol=1e-14,
+                                err_msg=f"Failed for {k}")
+        # the cached trajectory is used for scales within its range
+        n_cache = len(rge._sm_cache)
+        C_out_sm = rge.smeft_evolve_sm(C_in, 1000, 700, **kwargs)
+        self.assertEqual(len(rge._sm_cache), n_cache)
+        C_out = rge.smeft_evolve(C_in, 1000, 700, newphys=False, **kwargs)
+        npt.assert_allclose(C_out_sm['Gu'], C_out['Gu'], rtol=1e-6)
+
     def test_array2dict(self):
         d1 = smeftutil.C_array2dict(beta.beta_array(C,  HIGHSCALE))
         d2 = beta.beta(C, HIGHSCALE)
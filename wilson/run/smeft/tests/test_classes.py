@@ -1,12 +1,113 @@
 import unittest
 import numpy as np
 import numpy.testing as npt
-from wilson.run.smeft import SMEFT, beta
+from wilson.run.smeft import SMEFT, beta, rge, run_batch, symmetry
 from wilson.test_wilson import get_random_wc
 from wilson.util import smeftutil
 from wilson import wcxf
 
 
+# Wilson coefficients at 1 TeV used to compare the approximations to the
+# running to 160 GeV and Wilson coefficients compared for random inputs
+WC_APPROX = {'qq1_1111': 1e-8, 'phiD': 2e-8,
+             'lq3_2223': {'Re': 1e-8, 'Im': 2e-8}}
+KEYS_APPROX = ['qq1_1111', 'phiD', 'lq3_2223', 'lq1_2223', 'phiBox']
+KEYS_RANDOM = ['qq1_1111', 'phiD', 'lq3_2223', 'uG_33']
+
+
+def max_deviation(C, C_ref, keys=KEYS_APPROX):
+    """Return the largest relative deviation of the Wilson coefficients
+    `keys` in `C` from the ones in `C_ref`."""
+    return max(abs(C[k] / C_ref[k] - 1) for k in keys)
+
+
+class TestAccuracy(unittest.TestCase):
+    """Compare the approximations to the running with a numerical solution
+    of high precision."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.wc = wcxf.WC('SMEFT', 'Warsaw', 1000, WC_APPROX)
+        cls.smeft = SMEFT(cls.wc)
+        cls.C_ref = cls.smeft.run(160, rtol=1e-10, atol=1e-20).dict
+
+    def deviation(self, accuracy='integrate', **kwargs):
+        return max_deviation(self.smeft.run(160, accuracy, **kwargs).dict,
+                             self.C_ref)
+
+    def test_integrate(self):
+        # the default relative tolerance of solve_ivp is 1e-3
+        self.assertLess(self.deviation(), 1e-3)
+
+    def test_linear(self):
+        C_lin = SMEFT(self.wc, get_smpar=False).run(160, 'linear').dict
+        # the SM parameters are the ones for vanishing Wilson coefficients
+        self.assertLess(max_deviation(C_lin, self.C_ref), 1e-4)
+        # for the same nonzero Wilson coefficients, the cached columns of the
+        # evolution matrix are reused
+        n_columns = sum(len(c['columns']) for c in rge._linear_cache.values())
+        wc_2 = wcxf.WC('SMEFT', 'Warsaw', 1000, wcxf.WC.dict2values(
+            {k: 3 * v for k, v in self.wc.dict.items()}))
+        C_lin_2 = SMEFT(wc_2, get_smpar=False).run(160, 'linear').dict
+        self.assertEqual(sum(len(c['columns']) for c in rge._linear_cache.values()),
+                         n_columns)
+        self.assertLess(max_deviation(C_lin_2, {k: 3 * v for k, v in C_lin.items()}),
+                        1e-12)
+        # columns integrated later use the same SM trajectory, so earlier
+        # results are unchanged
+        wc_3 = wcxf.WC('SMEFT', 'Warsaw', 1000, {'lq1_1111': 1e-8})
+        SMEFT(wc_3, get_smpar=False).run(160, 'linear')
+        self.assertEqual(SMEFT(self.wc, get_smpar=False).run(160, 'linear').dict,
+                         C_lin)
+
+    def test_implicit(self):
+        rge._jacobian_cache.clear()
+        self.assertLess(self.deviation('implicit'), 1e-3)
+        timings = self.smeft.run_info['timings']
+        self.assertEqual(len(rge._jacobian_cache), 1)
+        # the columns of the Jacobian along the Wilson coefficients are
+        # reused for the same SM parameters at the input scale
+        self.assertLess(self.deviation('implicit', method='BDF', atol=1e-20), 1e-5)
+        self.assertEqual(len(rge._jacobian_cache), 1)
+        self.assertLess(self.smeft.run_info['timings']['jacobian'],
+                        timings['jacobian'] / 3)
+
+    def test_exponential(self):
+        deviation_1 = self.deviation('exponential', segments=1)
+        deviation_10 = self.deviation('exponential', segments=10)
+        # the error is of second order in the length of the segments
+        self.assertLess(deviation_10, deviation_1 / 50)
+        self.assertLess(deviation_10, 1e-4)
+
+    def test_taylor(self):
+        C_ll = self.smeft.run(160, 'leadinglog').dict
+        C_1 = self.smeft.run(160, 'taylor', order=1).dict
+        # to first order, the expansion is the leading log approximation
+        self.assertLess(max_deviation(C_1, C_ll), 1e-10)
+        # the error decreases with the order
+        deviations = [self.deviation('taylor', order=order) for order in (1, 2, 4, 6)]
+        for d, d_next in zip(deviations[:-1], deviations[1:]):
+            self.assertLess(d_next, d / 5)
+        C_4 = self.smeft.run(160, 'taylor', order=4).dict
+        for wc_out in run_batch([self.wc, self.wc], 160, accuracy='taylor', order=4):
+            self.assertLess(max_deviation(wc_out, C_4), 1e-8)
+        # no running for equal input and output scales
+        C_in = self.smeft.run(1000, 'leadinglog').dict
+        self.assertEqual(self.smeft.run(1000, 'taylor', order=4).dict, C_in)
+        for wc_out in run_batch([self.wc, self.wc], 1000, accuracy='taylor'):
+            self.assertEqual(wc_out.dict, C_in)
+
+    def test_rk4(self):
+        deviation_4 = self.deviation(method='RK4', steps=4)
+        deviation_8 = self.deviation(method='RK4', steps=8)
+        # the error is of fourth order in the step size
+        self.assertLess(deviation_8, deviation_4 / 10)
+        self.assertLess(deviation_4, 1e-5)
+        C_rk4 = self.smeft.run(160, method='RK4', steps=4).dict
+        for wc_out in run_batch([self.wc, self.wc], 160, method='RK4', steps=4):
+            self.assertLess(max_deviation(wc_out, C_rk4), 1e-8)
+
+
 class TestSMEFT(unittest.TestCase):
     def test_smeft(self):
         wc = get_random_wc('SMEFT', 'Warsaw', 1000, 1e-8)
@@ -19,6 +120,112 @@ class TestSMEFT(unittest.TestCase):
         wc.validate()
         wc = smeft.run(900, 'leadinglog')
         wc.validate()
+        with self.assertRaises(ValueError):
+            smeft.run(900, 'implicit', method='RK45')
+
+    def test_run_batch(self):
+        wcs = [get_random_wc('SMEFT', 'Warsaw', 1000, 1e-8) for _ in range(3)]
+        wcs_out = run_batch(wcs, 900)
+        self.assertEqual(len(wcs_out), 3)
+        for wc, wc_out in zip(wcs, wcs_out):
+            wc_out.validate()
+            wc_single = SMEFT(wc).run(900)
+            self.assertLess(max_deviation(wc_out, wc_single, KEYS_RANDOM), 1e-4)
+        with self.assertRaises(ValueError):
+            run_batch([wcs[0], get_random_wc('SMEFT', 'Warsaw', 500, 1e-8)], 900)
+
+    def test_run_many(self):
+        wc = get_random_wc('SMEFT', 'Warsaw', 1000, 1e-8)
+        smeft = SMEFT(wc)
+        scales = [160, 2000, 1000, 500]
+        wcs_out = smeft.run_many(scales)
+        self.assertEqual([wc_out.scale for wc_out in wcs_out], scales)
+        for scale, wc_out in zip(scales, wcs_out):
+            wc_out.validate()
+            wc_single = smeft.run(scale)
+            self.assertLess(max_deviation(wc_out, wc_single, KEYS_RANDOM), 1e-4,
+                            msg=f"Failed at {scale}")
+        # the integration is stopped by a terminal event at 300 GeV
+        def event(t, y):
+            return t - np.log(300)
+        event.terminal = True
+        with self.assertRaises(RuntimeError):
+            smeft.run_many([160, 500], events=event)
+
+    def test_auto(self):
+        wc = get_random_wc('SMEFT', 'Warsaw', 1000, 1e-8)
+        smeft = SMEFT(wc)
+        wc_out = smeft.run(990, 'auto')
+        self.assertEqual(smeft.run_info['accuracy'], 'leadinglog')
+        estimate = smeft.run_info['error_estimate']
+        self.assertLess(estimate, 1e-3)
+        self.assertEqual(wc_out.dict, smeft.run(990, 'leadinglog').dict)
+        # the estimate has the size of the actual error relative to the
+        # largest Wilson coefficient
+        C_ref = smeft.run(990, rtol=1e-10, atol=1e-20).dict
+        C_ll = wc_out.dict
+        error = (max(abs(C_ll.get(k, 0) - C_ref.get(k, 0)) for k in {*C_ll, *C_ref})
+                 / max(abs(v) for v in C_ref.values()))
+        self.assertLess(error, 3 * estimate)
+        self.assertGreater(error, estimate / 3)
+        wc_out = smeft.run(160, 'auto', tolerance=1e-6)
+        self.assertEqual(smeft.run_info['accuracy'], 'integrate')
+        self.assertGreater(smeft.run_info['error_estimate'], 1e-6)
+        self.assertEqual(wc_out.dict, smeft.run(160).dict)
+
+    def test_run_info(self):
+        wc = get_random_wc('SMEFT', 'Warsaw', 1000, 1e-8)
+        smeft = SMEFT(wc)
+        smeft.run(160)
+        info = smeft.run_info
+        self.assertEqual(info['solver']['status'], 0)
+        self.assertGreater(info['solver']['nfev'], 0)
+        self.assertGreater(info['solver']['steps'], 0)
+        for k in ['beta', 'packing', 'rotation', 'total']:
+            self.assertGreater(info['timings'][k], 0, msg=f"Failed for {k}")
+        self.assertLess(info['timings']['beta'], info['timings']['total'])
+        smeft.run(160, 'leadinglog')
+        self.assertIsNone(smeft.run_info['solver'])
+        smeft.run_many([160, 2000])
+        self.assertGreater(smeft.run_info['solver']['nfev'], 0)
+
+    def test_state_layout(self):
+        C_in = SMEFT(get_random_wc('SMEFT', 'Warsaw', 1000, 1e-6)).C_in
+        y = smeftutil.C_dict2array(C_in).astype(complex)
+        _, idx = rge._active_indices(C_in)
+        gather, scatter = rge._state_layout(y, idx)
+        self.assertLess(len(gather), 2 * len(idx))
+        # the beta functions of the state reproduce the ones of all
+        # parameters, also for Wilson coefficients whose beta functions do
+        # not have their symmetries
+        dy = beta.beta_array(C_in).view(float)
+        rows = np.unique(scatter.nonzero()[0])
+        npt.assert_allclose((scatter @ dy[gather])[rows], dy[rows],
+                            rtol=0, atol=1e-12 * np.abs(dy).max())
+
+    def test_flavor_symmetry(self):
+        # number of real invariants, see e.g. 2005.05366
+        basis = symmetry.invariant_basis('U(3)^5')
+        self.assertEqual(sum(N.shape[1] for N in basis.values()), 47)
+        with self.assertRaises(ValueError):
+            symmetry.invariant_basis('U(4)^5')
+        wc = wcxf.WC('SMEFT', 'Warsaw', 1000,
+                     {'phil1_11': 1e-8, 'phil1_22': 1e-8, 'phil1_33': 1e-8,
+                      'phiD': 2e-8})
+        smeft = SMEFT(wc)
+        wc_out = smeft.run(160, flavor_symmetry='U(3)^5')
+        wc_out.validate()
+        self.assertGreater(smeft.run_info['solver']['nfev'], 0)
+        self.assertGreater(smeft.run_info['timings']['beta'], 0)
+        wc_full = smeft.run(160)
+        for k in ['phil1_11', 'phil1_33', 'phiD']:
+            self.assertAlmostEqual(wc_out[k] / wc_full[k], 1, delta=0.01,
+                                   msg=f"Failed for {k}")
+        self.assertAlmostEqual(wc_out['phie_11'] / wc_out['phie_33'], 1,
+                               places=8)
+        self.assertNotIn('phil1_12', wc_out.dict)
+        with self.assertRaises(ValueError):
+            smeft.run(160, 'leadinglog', flavor_symmetry='U(3)^5')
 
     def test_empty(self):
         wc_sm = wcxf.WC('SMEFT', 'Warsaw', 160, {})
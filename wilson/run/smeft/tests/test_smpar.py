@@ -208,3 +208,27 @@ class TestGetSMpar(unittest.TestCase):
         for k, v in p_out.items():
             self.assertAlmostEqual(v / p_def[k], 1, places=1,
                                    msg=f"Failed for {k}")
+
+    def test_cache(self):
+        wc = get_random_wc('SMEFT', 'Warsaw', 1000, 1e-6)
+        smeft = SMEFT(wc)
+        # the cached result agrees with the iterative procedure using all
+        # Wilson coefficients
+        _smeft = SMEFT(wc, get_smpar=False)
+        _smeft.C_in.update(smeft._run_sm_scale_in(smeft.C_in))
+        C_SM = smeft._run_sm_scale_in(_smeft._rgevolve_leadinglog(91.1876))
+        for k, v in C_SM.items():
+            np.testing.assert_allclose(smeft.C_in[k], v, rtol=1e-12,
+                                       err_msg=f"Failed for {k}")
+        smeft_1 = SMEFT(wcxf.WC('SMEFT', 'Warsaw', 1000, {'qq1_1111': 1e-7, 'phiD': 1e-7}))
+        smeft_2 = SMEFT(wcxf.WC('SMEFT', 'Warsaw', 1000, {'qq1_1111': 1e-7, 'phiD': 1e-7,
+                                                          'duql_1111': 1e-7}))
+        smeft_3 = SMEFT(wcxf.WC('SMEFT', 'Warsaw', 1000, {'qq1_1111': 2e-7, 'phiD': 1e-7}))
+        for k in ['Lambda', 'm2', 'Gu', 'Gd']:
+            # baryon number violating operators do not mix into the
+            # coefficients affecting the SM parameters
+            np.testing.assert_array_equal(smeft_1.C_in[k], smeft_2.C_in[k])
+            self.assertFalse(np.array_equal(smeft_1.C_in[k], smeft_3.C_in[k]))
+        # modifying the output does not affect the cache
+        smeft_1.C_in['Gu'][0, 0] = 0
+        self.assertNotEqual(SMEFT(smeft_2.wc).C_in['Gu'][0, 0], 0)
@@ -9,6 +9,12 @@ from wilson.run.wet import rge, definitions
 from wilson.parameters import p as default_parameters
 from collections import OrderedDict
 import numpy as np
+import scipy.sparse
+
+
+# the EFTs of the chain WET -> WET-4 -> WET-3 with their numbers of quark
+# flavours
+EFT_FLAVOURS = OrderedDict([('WET', 5), ('WET-4', 4), ('WET-3', 3)])
 
 
 class WETrunner:
@@ -54,14 +60,11 @@ class WETrunner:
 
     def _get_running_parameters(self, scale, f, loop=3):
         """Get the running parameters (e.g. quark masses and the strong
-        coupling at a given scale."""
-        p = {}
-        p['alpha_s'] = qcd.alpha_s(scale, self.f, self.parameters['alpha_s'], loop=loop)
-        p['m_b'] = qcd.m_b(self.parameters['m_b'], scale, self.f, self.parameters['alpha_s'], loop=loop)
-        p['m_c'] = qcd.m_c(self.parameters['m_c'], scale, self.f, self.parameters['alpha_s'], loop=loop)
-        p['m_s'] = qcd.m_s(self.parameters['m_s'], scale, self.f, self.parameters['alpha_s'], loop=loop)
-        p['m_u'] = qcd.m_s(self.parameters['m_u'], scale, self.f, self.parameters['alpha_s'], loop=loop)
-        p['m_d'] = qcd.m_s(self.parameters['m_d'], scale, self.f, self.parameters['alpha_s'], loop=loop)
+        coupling at a given scale. If `scale` is an array, the running
+        parameters are arrays of the same shape."""
+        p = {k: v[()] for k, v in
+             qcd.running_parameters(scale, self.f, self.parameters,
+                                    loop=loop).items()}
         # running ignored for alpha_e and lepton mass
         p['alpha_e'] = self.parameters['alpha_e']
         p['m_e'] = self.parameters['m_e']
@@ -73,16 +76,144 @@ class WETrunner:
         p_i = self._get_running_parameters(self.scale_in, self.f)
         p_o = self._get_running_parameters(scale_out, self.f)
         Etas = (p_i['alpha_s'] / p_o['alpha_s'])
+        # group the sectors by class, such that sectors sharing the same
+        # anomalous dimension matrices are evolved at once
+        sector_list = self._get_sectors(sectors)
+        classes = OrderedDict()
+        for sector in sector_list:
+            classes.setdefault(definitions.sectors[sector], []).append(sector)
+        C_class = {}
+        for class_sectors in classes.values():
+            C_class.update(rge.run_sectors(class_sectors, self.C_in,
+                                           Etas, self.f, p_i, p_o,
+                                           qed_order=self.qed_order,
+                                           qcd_order=self.qcd_order))
         C_out = OrderedDict()
-        for sector in wcxf.EFT[self.eft].sectors:
-            if sector in definitions.sectors:
-                if sectors == 'all' or sector in sectors:
-                    C_out.update(rge.run_sector(sector, self.C_in,
-                                                Etas, self.f, p_i, p_o,
-                                                qed_order=self.qed_order,
-                                                qcd_order=self.qcd_order))
+        for sector in sector_list:
+            for key in rge.get_keys(sector, self.f):
+                C_out[key] = C_class[key]
         return C_out
 
+    def _get_sectors(self, sectors='all', eft=None):
+        """Return the list of sectors of the EFT (by default, the one of the
+        instance) that are run, restricted to `sectors` unless it is
+        'all'."""
+        return [sector for sector in wcxf.EFT[eft or self.eft].sectors
+                if sector in definitions.sectors
+                and (sectors == 'all' or sector in sectors)]
+
+    def wc_keys(self, sectors='all', eft=None):
+        """Return the list of names of Wilson coefficients that defines the
+        order of the components of arrays of Wilson coefficients (see
+        `evolution_operator` and `run_array`).
+
+        Parameters:
+
+        - sectors: optional. If provided, must be a tuple of strings
+          corresponding to WCxf sector names. Only Wilson coefficients
+          belonging to these sectors will be included.
+        - eft: optional. EFT of the Wilson coefficients (by default, the
+          EFT of the instance).
+        """
+        eft = eft or self.eft
+        return [key for sector in self._get_sectors(sectors, eft=eft)
+                for key in rge.get_keys(sector, EFT_FLAVOURS[eft])]
+
+    def _evolution_operator(self, scale_out, sectors='all'):
+        """Return the evolution matrix within the EFT of the instance, see
+        `evolution_operator`."""
+        p_i = self._get_running_parameters(self.scale_in, self.f)
+        p_o = self._get_running_parameters(scale_out, self.f)
+        Etas = (p_i['alpha_s'] / p_o['alpha_s'])
+        blocks = [rge.get_evolution_matrix(sector, Etas, self.f, p_i, p_o,
+                                           qed_order=self.qed_order,
+                                           qcd_order=self.qcd_order)
+                  for sector in self._get_sectors(sectors)]
+        return scipy.sparse.block_diag(blocks, format='csr')
+
+    def _matching_operator(self, eft_in, eft_out, sectors='all'):
+        """Return the matrix matching the array of Wilson coefficients of
+        `eft_in` to the one of `eft_out` at a quark threshold as
+        `scipy.sparse.csr_matrix`. At the order considered, the matching
+        just discards the Wilson coefficients not present in `eft_out`
+        (see `wilson.match`). For `eft_in` equal to `eft_out`, this
+        is the projection on the Wilson coefficients present in the basis
+        (some sectors of WET-4 and WET-3 contain coefficients that are only
+        needed for the dimension of their ADMs and are discarded by
+        `run`)."""
+        index_in = {k: i for i, k in enumerate(self.wc_keys(sectors, eft=eft_in))}
+        keys_out = self.wc_keys(sectors, eft=eft_out)
+        all_wcs = set(wcxf.Basis[eft_out, 'JMS'].all_wcs)  # to speed up lookup
+        rows = [i for i, k in enumerate(keys_out)
+                if k in index_in and k in all_wcs]
+        cols = [index_in[keys_out[i]] for i in rows]
+        return scipy.sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                                       shape=(len(keys_out), len(index_in)))
+
+    def evolution_operator(self, scale_out, sectors='all', eft_out=None,
+                           scale_mb=4.2, scale_mc=1.3):
+        """Return the matrix evolving the array of Wilson coefficients (with
+        components ordered as in `wc_keys`) from the input scale to the
+        scale `scale_out` as `scipy.sparse.csr_matrix`.
+
+        Within one EFT, the matrix is block diagonal. If the output EFT
+        differs from the one of the instance, the matrix is the product
+        of the evolution matrices in the EFTs of the chain
+        WET -> WET-4 -> WET-3 and the matching matrices at the quark
+        thresholds, mapping to the array of Wilson coefficients ordered as
+        in `wc_keys(sectors, eft=eft_out)`. This reproduces
+        `wilson.Wilson.match_run` for the same matching scales and orders.
+
+        Parameters:
+
+        - scale_out: output scale
+        - sectors: optional, see `wc_keys`.
+        - eft_out: optional. Output EFT (by default, the EFT of the
+          instance), one of 'WET', 'WET-4', or 'WET-3'.
+        - scale_mb, scale_mc: optional. Matching scales at the b and c quark
+          thresholds (by default 4.2 and 1.3 GeV).
+        """
+        efts = list(EFT_FLAVOURS)
+        eft_out = eft_out or self.eft
+        if eft_out not in efts or efts.index(eft_out) < efts.index(self.eft):
+            raise ValueError(f"Running from {self.eft} to {eft_out} not implemented")
+        efts = efts[efts.index(self.eft):efts.index(eft_out) + 1]
+        thresholds = {'WET-4': scale_mb, 'WET-3': scale_mc}
+        scales = [thresholds[eft] for eft in efts[1:]] + [scale_out]
+        U = self._evolution_operator(scales[0], sectors=sectors)
+        for eft_in, eft, scale_in, scale in zip(efts[:-1], efts[1:], scales[:-1], scales[1:]):
+            runner = WETrunner(wcxf.WC(eft, 'JMS', scale_in, {}),
+                               parameters=self.parameters,
+                               qed_order=self.qed_order,
+                               qcd_order=self.qcd_order)
+            U = (runner._evolution_operator(scale, sectors=sectors)
+                 @ self._matching_operator(eft_in, eft, sectors=sectors)
+                 @ U)
+        return self._matching_operator(eft_out, eft_out, sectors=sectors) @ U
+
+    def run_array(self, C_in, scale_out, sectors='all', **kwargs):
+        """Evolve arrays of Wilson coefficients to the scale `scale_out`.
+
+        Parameters:
+
+        - C_in: array of shape `(N, n_wc)` (or `(n_wc,)`) containing the
+          values of the Wilson coefficients of `N` parameter points at the
+          input scale, where the components are ordered as in `wc_keys`.
+        - scale_out: output scale
+        - sectors: optional, see `wc_keys`.
+
+        Additional keyword arguments (output EFT and matching scales) are
+        passed to `evolution_operator`.
+
+        Returns an array of shape `(N, n_wc_out)` (or `(n_wc_out,)`). Note
+        that the Wilson coefficients of the instance are ignored, only its
+        input scale and parameters are used. To evolve many arrays of
+        Wilson coefficients, it is more efficient to compute the matrix
+        `evolution_operator` once and apply it.
+        """
+        U = self.evolution_operator(scale_out, sectors=sectors, **kwargs)
+        return (U @ np.asarray(C_in).T).T
+
     def run(self, scale_out, sectors='all'):
         """Evolve the Wilson coefficients to the scale `scale_out`.
 
@@ -104,6 +235,15 @@ class WETrunner:
                        values=wcxf.WC.dict2values(C_out))
 
     def run_continuous(self, scale, sectors='all'):
+        """Return a continuous solution to the RGE as `RGsolution` instance.
+
+        The solution is a function of the scale that returns a dictionary
+        with arrays of the shape of its argument as values (one entry per
+        Wilson coefficient). As the evolution is evaluated in closed form
+        for all scales at once (see `rge.evolve_array`), its cost is
+        almost independent of the number of scales. Like in `run`, the
+        running parameters are obtained from interpolation tables (see
+        `wilson.util.qcd.running_parameters`)."""
         if scale == self.scale_in:
             raise ValueError("The scale must be different from the input scale")
         elif scale < self.scale_in:
@@ -112,10 +252,8 @@ class WETrunner:
         elif scale > self.scale_in:
             scale_max = scale
             scale_min = self.scale_in
-        @np.vectorize
-        def _f(scale):
-            return self._run_dict(scale, sectors=sectors)
         def f(scale):
-            # this is to return a scalar if the input is scalar
-            return _f(scale)[()]
+            scale = np.asarray(scale, dtype=float)
+            C_out = self._run_dict(scale, sectors=sectors)
+            return {k: v.reshape(scale.shape) for k, v in C_out.items()}
         return wilson.classes.RGsolution(f, scale_min, scale_max)
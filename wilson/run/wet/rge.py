@@ -7,7 +7,7 @@ from collections import OrderedDict
 import numpy as np
 from functools import lru_cache
 from wilson.run.wet import adm
-from math import log, sqrt, pi
+from math import pi
 from wilson import wcxf
 
 @lru_cache(maxsize=32)
@@ -50,35 +50,140 @@ def admeig(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
     return w, v
 
 
-@lru_cache(maxsize=32)
-def getUs(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
-    """Get the QCD evolution matrix."""
+@lru_cache(maxsize=256)
+def eigensystem(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+    r"""Return the exponents $a_i = \gamma_i / (2\beta_0)$ of the QCD evolution
+    matrix of class `classname`, the matrix of eigenvectors $V$ of the
+    transposed ADM (see `admeig`), and its inverse.
+
+    The QCD evolution matrix is $V \operatorname{diag}(\eta_s^{a_i}) V^{-1}$,
+    so it only requires elementwise powers and matrix multiplications once
+    the eigensystem is known. Supports memoization."""
     w, v = admeig(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau)
     b0s = 11 - 2 * f / 3
-    a = w / (2 * b0s)
-    return v @ np.diag(eta_s**a) @ np.linalg.inv(v)
+    return w / (2 * b0s), v, np.linalg.inv(v)
+
+
+def getUs_array(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+    """Get the QCD evolution matrix for an array of values of `eta_s`.
+
+    Returns an array of shape `eta_s.shape + (n, n)`, where `n` is the
+    number of Wilson coefficients in the class."""
+    a, v, v_inv = eigensystem(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau)
+    eta_s = np.asarray(eta_s)
+    return (v * eta_s[..., None, None]**a) @ v_inv
 
 
 @lru_cache(maxsize=32)
-def getUe(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+def getUs(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
     """Get the QCD evolution matrix."""
+    return getUs_array(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau)
+
+
+@lru_cache(maxsize=256)
+def qedeig(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+    """Return the transposed QED anomalous dimension matrix that is defined
+    in `adm.adm_e_X` where X is the name of the sector in the eigenbasis of
+    the QCD anomalous dimension matrix (see `eigensystem`).
+
+    Supports memoization."""
     args = f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau
     A = getattr(adm, 'adm_e_' + classname)(*args)
     perm_keys = get_permissible_wcs(classname, f)
     if perm_keys != 'all':
         # remove disallowed rows & columns if necessary
         A = A[perm_keys][:, perm_keys]
-    w, v = admeig(classname, *args)
+    a, v, v_inv = eigensystem(classname, *args)
+    return v_inv @ A.T @ v
+
+
+def _degenerate(a):
+    """Return the matrix $a_i - a_j - 1$ for the exponents `a` (see
+    `eigensystem`) and a mask of its vanishing elements. Elements that only
+    differ from zero by rounding errors are treated as vanishing, as the
+    QED evolution would otherwise be dominated by the rounding errors."""
+    d = a[:, None] - a[None, :] - 1
+    return d, np.abs(d) < 1e-10
+
+
+def getUe_array(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+    """Get the QED evolution matrix for an array of values of `eta_s`.
+
+    Returns an array of shape `eta_s.shape + (n, n)`, where `n` is the
+    number of Wilson coefficients in the class."""
+    args = f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau
+    a, v, v_inv = eigensystem(classname, *args)
+    K = qedeig(classname, *args)
     b0s = 11 - 2 * f / 3
-    a = w / (2 * b0s)
-    K = np.linalg.inv(v) @ A.T @ v
-    for i in range(K.shape[0]):
-        for j in range(K.shape[1]):
-            if a[i] - a[j] != 1:
-                K[i, j] *= (eta_s**(a[j] + 1) - eta_s**a[i]) / (a[i] - a[j] - 1)
-            else:
-                K[i, j] *= eta_s**a[i] * log(1 / eta_s)
-    return -alpha_e / (2 * b0s * alpha_s) * v @ K @ np.linalg.inv(v)
+    eta_s = np.asarray(eta_s)[..., None, None]
+    a_i = a[:, None]
+    a_j = a[None, :]
+    # mask for the degenerate case a_i - a_j = 1
+    d, degenerate = _degenerate(a)
+    K = K * np.where(degenerate,
+                     eta_s**a_i * np.log(1 / eta_s),
+                     (eta_s**(a_j + 1) - eta_s**a_i) / np.where(degenerate, 1, d))
+    return -alpha_e / (2 * b0s * alpha_s) * v @ K @ v_inv
+
+
+@lru_cache(maxsize=32)
+def getUe(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau):
+    """Get the QED evolution matrix."""
+    return getUe_array(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau)
+
+
+def getU(classname, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau, qed_order=1, qcd_order=1):
+    """Get the QCD and the QED evolution matrices (see `getUs` and `getUe`)
+    at the given orders, sharing the eigensystem of the QCD anomalous
+    dimension matrix between them."""
+    args = f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau
+    if qcd_order == 0:
+        a, v, v_inv = eigensystem(classname, f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau)
+        Us = np.eye(len(a))
+        eta_e = 1
+    elif qcd_order == 1:
+        Us = getUs(classname, eta_s, *args)
+        eta_e = eta_s
+    if qed_order == 0:
+        Ue = np.zeros(Us.shape)
+    elif qed_order == 1:
+        Ue = getUe(classname, eta_e, *args)
+    return Us, Ue
+
+
+def evolve_array(classname, C, eta_s, f, alpha_s, alpha_e, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau, qed_order=1, qcd_order=1):
+    r"""Evolve the Wilson coefficients `C` of class `classname`, an array of
+    shape `(n, m)` containing the (normalized, see `scale_C`) Wilson
+    coefficients of `m` sectors as columns, for an array of values of
+    `eta_s`.
+
+    Equivalent to applying the evolution matrices `getU`, but without
+    constructing them: in the eigenbasis of the QCD anomalous dimension
+    matrix, the QCD evolution is diagonal and the QED evolution reduces to
+    two matrix products with the Wilson coefficients, so the cost is
+    $O(n^2 m)$ per value of `eta_s`.
+
+    Returns an array of shape `eta_s.shape + (n, m)`."""
+    eta_s = np.asarray(eta_s)
+    if qcd_order == 0:
+        # the QED evolution vanishes for eta_s = 1 (see `getU`)
+        return np.broadcast_to(C, eta_s.shape + C.shape).copy()
+    args = f, m_u, m_d, m_s, m_c, m_b, m_e, m_mu, m_tau
+    a, v, v_inv = eigensystem(classname, *args)
+    z = v_inv @ C
+    eta = eta_s[..., None, None]
+    E = eta_s[..., None, None]**a[:, None]
+    res = E * z
+    if qed_order == 1:
+        K = qedeig(classname, *args)
+        b0s = 11 - 2 * f / 3
+        # mask for the degenerate case a_i - a_j = 1
+        d, degenerate = _degenerate(a)
+        M = np.where(degenerate, 0, K / np.where(degenerate, 1, d))
+        L = np.where(degenerate, K, 0)
+        y = eta * (M @ (E * z)) - E * (M @ z) + E * np.log(1 / eta) * (L @ z)
+        res = res - alpha_e / (2 * b0s * alpha_s) * y
+    return v @ res
 
 
 qG = ['uG', 'dG']
@@ -101,8 +206,8 @@ def get_m(dipole_key):
 
 
 def scale_C(key, p):
-    g = sqrt(4 * pi * p['alpha_s'])
-    e = sqrt(4 * pi * p['alpha_e'])
+    g = np.sqrt(4 * pi * p['alpha_s'])
+    e = np.sqrt(4 * pi * p['alpha_e'])
     name = key.split('_')[0]
     if  name in qG:
         m = p[get_m(key)]
@@ -116,6 +221,87 @@ def scale_C(key, p):
         return 1
 
 
+def get_keys(sector, f):
+    """Return the list of names of Wilson coefficients of the sector `sector`
+    that exist in the theory with `f` quark flavours."""
+    keylist = coeffs[sector]
+    if sector == 'dF=0':
+        perm_keys = get_permissible_wcs('dF0', f)
+    else:
+        perm_keys = get_permissible_wcs(sector, f)
+    if perm_keys != 'all':
+        # remove disallowed keys if necessary
+        keylist = [keylist[i] for i in perm_keys]
+    return keylist
+
+
+def get_evolution_matrix(sector, eta_s, f, p_in, p_out, qed_order=1, qcd_order=1):
+    r"""Return the matrix evolving the Wilson coefficients of the sector
+    `sector` (in the order of `get_keys`) from the input to the output
+    scale, including the normalisation of the dipole and triple gluon
+    operators (see `scale_C`).
+
+    The parameters are as in `run_sector`."""
+    keylist = get_keys(sector, f)
+    classname = sectors[sector]
+    if classname == 'inv':
+        # RG invariant operators
+        return np.eye(len(keylist))
+    Us, Ue = getU(classname, eta_s, f, **p_in,
+                  qed_order=qed_order, qcd_order=qcd_order)
+    scale_in = np.array([scale_C(key, p_in) for key in keylist])
+    scale_out = np.array([scale_C(key, p_out) for key in keylist])
+    return (Us + Ue) * scale_in / scale_out[:, None]
+
+
+def run_sectors(sector_list, C_in, eta_s, f, p_in, p_out, qed_order=1, qcd_order=1):
+    r"""Solve the WET RGE for several sectors sharing the same class (i.e.
+    the same anomalous dimension matrices).
+
+    The Wilson coefficients of the sectors are stacked as columns of a
+    matrix, such that the evolution matrix is applied only once.
+
+    Parameters:
+
+    - sector_list: list of sectors of the same class
+    - the other parameters are as in `run_sector`
+
+    `eta_s` and the values of `p_out` can also be arrays of the same
+    shape, e.g. for several output scales, in which case the values of
+    the returned dictionary are arrays of this shape.
+    """
+    classname = sectors[sector_list[0]]
+    if any(sectors[sector] != classname for sector in sector_list):
+        raise ValueError("All sectors must belong to the same class.")
+    keylists = [get_keys(sector, f) for sector in sector_list]
+    shape = np.shape(eta_s)
+    if classname == 'inv':
+        # nothing to do for RG invariant operators
+        return OrderedDict((key, np.broadcast_to(C_in.get(key, 0), shape)[()])
+                           for keylist in keylists for key in keylist)
+    C_input = np.array([[C_in.get(key, 0) for key in keylist]
+                        for keylist in keylists]).T
+    if np.count_nonzero(C_input) == 0:
+        # nothing to do for SM-like WCs
+        C_result = np.broadcast_to(C_input, shape + C_input.shape)
+    else:
+        # normalisation of dipole operators etc. (see `scale_C`)
+        scale_in = np.array([[scale_C(key, p_in) for key in keylist]
+                             for keylist in keylists]).T
+        scale_out = np.array([[np.broadcast_to(scale_C(key, p_out), shape)
+                               for key in keylist]
+                              for keylist in keylists])
+        scale_out = np.moveaxis(scale_out, (0, 1), (-1, -2))
+        C_result = evolve_array(classname, C_input * scale_in, eta_s, f,
+                                **p_in, qed_order=qed_order,
+                                qcd_order=qcd_order) / scale_out
+    Cdictout = OrderedDict()
+    for j, keylist in enumerate(keylists):
+        for i, key in enumerate(keylist):
+            Cdictout[key] = C_result[..., i, j][()]
+    return Cdictout
+
+
 def run_sector(sector, C_in, eta_s, f, p_in, p_out, qed_order=1, qcd_order=1):
     r"""Solve the WET RGE for a specific sector.
 
@@ -128,35 +314,5 @@ def run_sector(sector, C_in, eta_s, f, p_in, p_out, qed_order=1, qcd_order=1):
     - p_in: running parameters at the input scale
     - p_out: running parameters at the output scale
     """
-    Cdictout = OrderedDict()
-    classname = sectors[sector]
-    keylist = coeffs[sector]
-    if sector == 'dF=0':
-        perm_keys = get_permissible_wcs('dF0', f)
-    else:
-        perm_keys = get_permissible_wcs(sector, f)
-    if perm_keys != 'all':
-        # remove disallowed keys if necessary
-        keylist = np.asarray(keylist)[perm_keys]
-    C_input = np.array([C_in.get(key, 0) for key in keylist])
-    if np.count_nonzero(C_input) == 0 or classname == 'inv':
-        # nothing to do for SM-like WCs or RG invariant operators
-        C_result = C_input
-    else:
-        C_scaled = np.asarray([C_input[i] * scale_C(key, p_in) for i, key in enumerate(keylist)])
-        if qcd_order == 0:
-            Us = np.eye(len(C_scaled))
-        elif qcd_order == 1:
-            Us = getUs(classname, eta_s, f, **p_in)
-        if qed_order == 0:
-            Ue = np.zeros(C_scaled.shape)
-        elif qed_order == 1:
-            if qcd_order == 0:
-                Ue = getUe(classname, 1, f, **p_in)
-            else:
-                Ue = getUe(classname, eta_s, f, **p_in)
-        C_out = (Us + Ue) @ C_scaled
-        C_result = [C_out[i] / scale_C(key, p_out) for i, key in enumerate(keylist)]
-    for j in range(len(C_result)):
-        Cdictout[keylist[j]] = C_result[j]
-    return Cdictout
+    return run_sectors([sector], C_in, eta_s, f, p_in, p_out,
+                       qed_order=qed_order, qcd_order=qcd_order)
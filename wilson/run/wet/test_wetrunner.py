@@ -1,6 +1,6 @@
 import unittest
 from wilson.run import wet
-from wilson import wcxf
+from wilson import wcxf, Wilson
 import numpy as np
 import numpy.testing as npt
 from wilson.run.wet import rge
@@ -71,6 +71,122 @@ class TestEvolutionMatrices(unittest.TestCase):
                                           np.linalg.inv(rge.getUs(c, 1/0.123, *args),),
                                           err_msg=f"Failed for {c}")
 
+    def test_array_s(self):
+        args = (5, 0.12, 1/128, 0, 0, 0.1, 1.2, 4.2, 0, 0.106, 1.77)
+        etas = np.array([[0.5, 0.9], [1, 1.3]])
+        for c in ['I', 'II', 'III', 'sb', 'cu']:
+            Us = rge.getUs_array(c, etas, *args)
+            self.assertEqual(Us.shape[:2], etas.shape)
+            for i in range(2):
+                for j in range(2):
+                    npt.assert_array_almost_equal(Us[i, j],
+                                                  rge.getUs(c, etas[i, j], *args),
+                                                  err_msg=f"Failed for {c}")
+            npt.assert_array_almost_equal(rge.getUs_array(c, 1, *args),
+                                          np.eye(len(Us[0, 0])))
+
+    def test_array_e(self):
+        args = (5, 0.12, 1/128, 0, 0, 0.1, 1.2, 4.2, 0, 0.106, 1.77)
+        etas = np.array([0.5, 1, 1.3])
+        for c in ['I', 'II', 'III', 'sb', 'cu']:
+            Ue = rge.getUe_array(c, etas, *args)
+            a, v, v_inv = rge.eigensystem(c, 5, *args[3:])
+            K = rge.qedeig(c, 5, *args[3:])
+            for eta, Ue_eta in zip(etas, Ue):
+                # explicit loop over the elements of K
+                K_eta = K.copy()
+                for i in range(len(a)):
+                    for j in range(len(a)):
+                        if abs(a[i] - a[j] - 1) > 1e-10:
+                            K_eta[i, j] *= (eta**(a[j] + 1) - eta**a[i]) / (a[i] - a[j] - 1)
+                        else:
+                            K_eta[i, j] *= eta**a[i] * np.log(1 / eta)
+                npt.assert_array_almost_equal(Ue_eta,
+                                              -1/128 / (2 * 23/3 * 0.12) * v @ K_eta @ v_inv,
+                                              err_msg=f"Failed for {c}")
+            Us, Ue_ = rge.getU(c, 0.5, *args)
+            npt.assert_array_almost_equal(Ue_, Ue[0])
+            npt.assert_array_almost_equal(Us, rge.getUs(c, 0.5, *args))
+
+
+class TestEvolutionOperator(unittest.TestCase):
+    def test_run_array(self):
+        for eft, scale_in, scale_out in [('WET', 160, 4.2), ('WET-3', 2, 1.2)]:
+            wc = get_random_wc(eft, 'JMS', scale_in)
+            wet_ = wet.WETrunner(wc)
+            keys = wet_.wc_keys()
+            self.assertEqual(len(keys), len(set(keys)))
+            U = wet_.evolution_operator(scale_out)
+            self.assertEqual(U.shape, (len(keys), len(keys)))
+            C_in = np.array([wc.dict.get(k, 0) for k in keys])
+            C_out = wet_._run_dict(scale_out)
+            C_out_array = wet_.run_array(np.array([C_in, 2 * C_in]), scale_out)
+            self.assertEqual(C_out_array.shape, (2, len(keys)))
+            # coefficients not present in the basis are discarded, as in `run`
+            all_wcs = set(wcxf.Basis[eft, 'JMS'].all_wcs)
+            npt.assert_allclose(C_out_array[0],
+                                [C_out[k] if k in all_wcs else 0 for k in keys],
+                                rtol=1e-10)
+            npt.assert_allclose(C_out_array[1], 2 * C_out_array[0], rtol=1e-12)
+        keys = wet_.wc_keys(sectors=('sbsb', 'dF=0'))
+        self.assertIn('VddLL_1122', keys)
+        self.assertNotIn('VnueduLL_1111', keys)
+
+    def test_thresholds(self):
+        wc = get_random_wc('WET', 'JMS', 160)
+        wet_ = wet.WETrunner(wc)
+        C_in = np.array([wc.dict.get(k, 0) for k in wet_.wc_keys()])
+        for eft, scale_out in [('WET-4', 2), ('WET-3', 1)]:
+            keys = wet_.wc_keys(eft=eft)
+            U = wet_.evolution_operator(scale_out, eft_out=eft)
+            self.assertEqual(U.shape, (len(keys), len(C_in)))
+            C_out = dict(zip(keys, wet_.run_array(C_in, scale_out, eft_out=eft)))
+            C_ref = Wilson.from_wc(wc).match_run(scale_out, eft, 'JMS').dict
+            for k, v in C_out.items():
+                self.assertAlmostEqual(v, C_ref.get(k, 0), delta=1e-10 * abs(v) + 1e-30,
+                                       msg=f"Failed for {k} in {eft}")
+        with self.assertRaises(ValueError):
+            wet.WETrunner(get_random_wc('WET-3', 'JMS', 2)).evolution_operator(1, eft_out='WET')
+
+
+class TestRunContinuous(unittest.TestCase):
+    def test_run_continuous(self):
+        wc = get_random_wc('WET', 'JMS', 160)
+        wet_ = wet.WETrunner(wc)
+        sol = wet_.run_continuous(4.2)
+        scales = np.array([4.2, 10, 100])
+        C_out = sol.fun(scales)
+        self.assertEqual(C_out['VddLL_2323'].shape, (3,))
+        for i, scale in enumerate(scales):
+            C_scale = wet_.run(scale).dict
+            for k in ['VddLL_2323', 'VnueduLL_1111', 'dgamma_23', 'dG_23']:
+                # the running parameters are interpolated in both cases
+                self.assertAlmostEqual(C_out[k][i] / C_scale[k], 1, places=12,
+                                       msg=f"Failed for {k} at {scale}")
+        x, y = sol.plotdata('VddLL_2323', steps=1000)
+        self.assertEqual(y.shape, (1000,))
+        self.assertEqual(y.dtype, float)
+        self.assertAlmostEqual(sol.fun(100)['VddLL_2323'] / C_out['VddLL_2323'][2],
+                               1, places=12)
+
+
+class TestRunSectors(unittest.TestCase):
+    def test_run_sectors(self):
+        wc = get_random_wc('WET', 'JMS', 160)
+        wet_ = wet.WETrunner(wc)
+        p_i = wet_._get_running_parameters(160, 5)
+        p_o = wet_._get_running_parameters(4.2, 5)
+        eta_s = p_i['alpha_s'] / p_o['alpha_s']
+        for c in ['II', 'Vb', 'III', 'inv']:
+            sector_list = wet.definitions.classes[c]
+            C_out = rge.run_sectors(sector_list, wc.dict, eta_s, 5, p_i, p_o)
+            for sector in sector_list:
+                for k, v in rge.run_sector(sector, wc.dict, eta_s, 5, p_i, p_o).items():
+                    self.assertAlmostEqual(C_out[k], v, places=12,
+                                           msg=f"Failed for {k}")
+        with self.assertRaises(ValueError):
+            rge.run_sectors(['sbsb', 'ubenu'], wc.dict, eta_s, 5, p_i, p_o)
+
 
 class TestClassWET4(unittest.TestCase):
 
@@ -24,6 +24,15 @@ def get_random_wc(eft, basis, scale, cmax=1e-6):
     return wcxf.WC(eft, basis, scale, wcxf.WC.dict2values(_wc))
 
 
+def get_wilson_qd1(value=1e-8, **options):
+    """Return a `Wilson` instance with a single SMEFT Wilson coefficient
+    at 1 TeV and the options `options`."""
+    w = wilson.Wilson({'qd1_1123': value}, 1000, 'SMEFT', 'Warsaw')
+    for k, v in options.items():
+        w.set_option(k, v)
+    return w
+
+
 def all_subclasses(cls):
     return set(cls.__subclasses__()).union(
         s for c in cls.__subclasses__() for s in all_subclasses(c))
@@ -105,6 +114,45 @@ class TestWilson(unittest.TestCase):
         wc = w.match_run(160, 'SMEFT', 'Warsaw up')
         wc.validate()
 
+    def test_run_smeft_linear(self):
+        wc = get_wilson_qd1(smeft_accuracy='linear').match_run(160, 'SMEFT', 'Warsaw')
+        wc.validate()
+        # the result is linear in the Wilson coefficients
+        wc_2 = get_wilson_qd1(3e-8, smeft_accuracy='linear').match_run(160, 'SMEFT', 'Warsaw')
+        for k in ['qd1_1123', 'qd8_1123', 'dG_23']:
+            self.assertAlmostEqual(wc_2[k] / wc[k], 3, places=10, msg=f"Failed for {k}")
+
+    def test_match_run_many(self):
+        w = get_wilson_qd1()
+        wcs = w.match_run_many([160, 500], 'SMEFT', 'Warsaw up')
+        self.assertEqual([wc.scale for wc in wcs], [160, 500])
+        self.assertGreater(w.smeft_run_info['solver']['nfev'], 0)
+        # results are cached
+        self.assertIs(w.match_run(500, 'SMEFT', 'Warsaw up'), wcs[1])
+        wcs = w.match_run_many([4.8, 2], 'WET', 'flavio')
+        self.assertEqual([wc.eft for wc in wcs], ['WET', 'WET'])
+
+    def test_smeft_checkpoints(self):
+        w = get_wilson_qd1()
+        w.match_run(200, 'SMEFT', 'Warsaw')
+        self.assertEqual(set(w._smeft._get_checkpoints()), {1000, 200})
+        # the running to the EW scale starts at 200 GeV
+        wc_ew = w.match_run(91.1876, 'WET', 'JMS')
+        self.assertEqual(set(w._smeft._get_checkpoints()), {1000, 200, 91.1876})
+        wc_ew_2 = get_wilson_qd1().match_run(91.1876, 'WET', 'JMS')
+        for k in ['V1ddLR_1123', 'V1udLR_1123']:
+            self.assertAlmostEqual(wc_ew[k] / wc_ew_2[k], 1, places=3)
+        # changing options invalidates the checkpoints
+        w.set_option('qcd_order', 0)
+        self.assertIsNone(w._smeft)
+
+    def test_smeft_accuracy_auto(self):
+        w = get_wilson_qd1(smeft_accuracy='auto')
+        w.match_run(990, 'SMEFT', 'Warsaw')
+        self.assertEqual(w.smeft_run_info['accuracy'], 'leadinglog')
+        w.set_option('smeft_tolerance', 1e-8)
+        w.match_run(990, 'SMEFT', 'Warsaw')
+        self.assertEqual(w.smeft_run_info['accuracy'], 'integrate')
 
     def test__translate_warsaw_to_warsawup(self):
         w_in = wilson.Wilson({'qd1_1211': 1e-6}, 1e3, 'SMEFT', 'Warsaw')
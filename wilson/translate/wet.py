@@ -1,7 +1,7 @@
 from math import pi, sqrt
 import numpy as np
 from wilson.parameters import p as default_parameters
-from wilson.util.qcd import alpha_s, m_b, m_s, m_c
+from wilson.util.qcd import running_parameters
 from wilson.util.wet_jms import rotate_down, symmetrize_JMS_dict, JMS_to_array
 import ckmutil.ckm, ckmutil.diag
 from wilson import wcxf
@@ -1906,13 +1906,10 @@ def get_parameters(scale, f=5, input_parameters=None):
         # if parameters are passed in, overwrite the default values
         p.update(input_parameters)
     parameters = {}
-    # running quark masses and alpha_s
-    parameters['m_b'] = m_b(p['m_b'], scale, f, p['alpha_s'])
-    parameters['m_c'] = m_c(p['m_c'], scale, f, p['alpha_s'])
-    parameters['m_s'] = m_s(p['m_s'], scale, f, p['alpha_s'])
-    parameters['m_u'] = m_s(p['m_u'], scale, f, p['alpha_s'])
-    parameters['m_d'] = m_s(p['m_d'], scale, f, p['alpha_s'])
-    parameters['alpha_s'] = alpha_s(scale, f, p['alpha_s'])
+    # running quark masses and alpha_s, evaluated exactly since the
+    # translated values should not depend on the interpolation tables
+    for k, v in running_parameters(scale, f, p, exact=True).items():
+        parameters[k] = float(v)
     # no running is performed for these parameters
     for k in ['m_W', 'm_Z', 'GF',
               'alpha_e',
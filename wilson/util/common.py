@@ -3,6 +3,7 @@ from itertools import chain
 import numbers
 from functools import reduce, partial
 import operator
+import scipy.sparse
 from wilson import wcxf
 
 
@@ -82,6 +83,8 @@ class EFTutil:
         self.C_keys_shape = keys_and_shapes["C_keys_shape"]
         self.C_keys = keys_and_shapes["C_keys"]
         self.dim4_keys = keys_and_shapes["dim4_keys"]
+        self.C_slices, self.C_size = self._get_slices()
+        self._packing = None
         self._needs_padding = n_gen != min(
             [min(v) for v in self.C_keys_shape.values() if v != 1]
         )
@@ -145,6 +148,23 @@ class EFTutil:
             "C_keys_shape": C_keys_shape,
         }
 
+    def _get_slices(self):
+        """Return a dictionary with the position of each key in the flat
+        array of C values (as `slice` or, for scalars, as integer index)
+        and the total length of that array."""
+        slices = {}
+        i = 0
+        for k in self.C_keys:
+            s = self.C_keys_shape[k]
+            if s == 1:
+                slices[k] = i
+                i += 1
+            else:
+                j = i + reduce(operator.mul, s, 1)
+                slices[k] = slice(i, j)
+                i = j
+        return slices, i
+
     def _get_symm_keys(self):
         sectors = wcxf.Basis[self.eft, self.basis].sectors
         C_keys_complex = dict(
@@ -255,23 +275,108 @@ class EFTutil:
         return C_out
 
     def C_array2dict(self, C):
-        """Convert a 1D array containing C values to a dictionary."""
+        """Convert a 1D array containing C values to a dictionary.
+
+        The arrays in the dictionary are views of `C`, i.e. no data is copied.
+        If `C` has additional leading (batch) axes, they are kept in front of
+        the shape of each value."""
         d = {}
-        i = 0
-        for k in self.C_keys:
-            s = self.C_keys_shape[k]
-            if s == 1:
-                j = i + 1
-                d[k] = C[i]
+        shapes = self.C_keys_shape
+        lead = np.shape(C)[:-1]
+        for k, sl in self.C_slices.items():
+            if lead:
+                sl = (Ellipsis, sl)
+            if shapes[k] == 1:
+                d[k] = C[sl]
             else:
-                j = i + reduce(operator.mul, s, 1)
-                d[k] = C[i:j].reshape(s)
-            i = j
+                d[k] = C[sl].reshape(lead + shapes[k])
         return d
 
-    def C_dict2array(self, C):
-        """Convert a dict containing C values to a 1D array."""
-        return np.hstack([np.asarray(C[k]).ravel() for k in self.C_keys])
+    def C_dict2array(self, C, out=None):
+        """Convert a dict containing C values to a 1D array.
+
+        If `out` is given, the values are written into this preallocated
+        array with last axis of length `C_size` instead of a new one. Leading
+        (batch) axes of `out` have to be present in the values as well.
+        In this case, keys missing in `C` leave the corresponding entries of
+        `out` untouched."""
+        if out is None:
+            return np.hstack([np.asarray(C[k]).ravel() for k in self.C_keys])
+        shapes = self.C_keys_shape
+        lead = out.shape[:-1]
+        for k in C:
+            sl = self.C_slices[k]
+            if shapes[k] == 1:
+                out[..., sl] = C[k]
+            else:
+                out[..., sl] = np.broadcast_to(
+                    C[k], lead + shapes[k]
+                ).reshape(lead + (-1,))
+        return out
+
+    def _get_packing(self):
+        """Return the indices of the independent real components in the
+        real representation (`C_dict2array(C).view(float)`) of the flat
+        array of C values and the sparse matrix mapping these components
+        back to the real representation of the symmetrized array.
+
+        The tables are determined once from `symmetrize` applied to unit
+        vectors and cached."""
+        if self._packing is not None:
+            return self._packing
+        idx = np.arange(self.C_size)
+        offsets = {k: np.atleast_1d(idx[self.C_slices[k]])
+                   for k in self.C_keys}
+        rows, cols, vals = [], [], []
+        for j in range(2 * max(len(o) for o in offsets.values())):
+            # unit vector j in all arrays at once
+            y = np.zeros(self.C_size, dtype=complex)
+            for k, o in offsets.items():
+                if j < 2 * len(o):
+                    y[o[j // 2]] = 1j if j % 2 else 1
+            C = self.symmetrize(self.C_array2dict(y))
+            z = self.C_dict2array(C).astype(complex).view(float)
+            for k, o in offsets.items():
+                if j < 2 * len(o):
+                    r = 2 * o[0] + np.flatnonzero(z[2 * o[0]:2 * o[-1] + 2])
+                    rows.append(r)
+                    cols.append(np.full(len(r), 2 * o[0] + j))
+                    vals.append(z[r])
+        S = scipy.sparse.csc_matrix(
+            (np.hstack(vals), (np.hstack(rows), np.hstack(cols))),
+            shape=(2 * self.C_size, 2 * self.C_size))
+        # the independent components are the ones symmetrize reads from
+        indices = np.flatnonzero(np.diff(S.indptr))
+        self._packing = indices, S[:, indices].tocsr()
+        return self._packing
+
+    @property
+    def packed_size(self):
+        """Number of independent real components of the flat array of C
+        values, see `C_array2packed`."""
+        return len(self._get_packing()[0])
+
+    def C_array2packed(self, C):
+        """Convert a (symmetrized) flat array of C values to a real array
+        containing only its independent real components, i.e. without the
+        entries fixed by the symmetries of the Wilson coefficients and
+        without the imaginary parts of real parameters.
+
+        If `C` has additional leading (batch) axes, they are kept."""
+        indices, _ = self._get_packing()
+        C = np.ascontiguousarray(C, dtype=complex)
+        return C.view(float)[..., indices]
+
+    def C_packed2array(self, x):
+        """Convert a real array of independent components, as returned by
+        `C_array2packed`, back to the symmetrized flat array of C values.
+
+        If `x` has additional leading (batch) axes, they are kept."""
+        _, M = self._get_packing()
+        lead = np.shape(x)[:-1]
+        y = M @ np.reshape(x, (-1, M.shape[1])).T
+        y = np.ascontiguousarray(y.T).view(complex)
+        return y.reshape(lead + (self.C_size,))
 
     @staticmethod
     def arrays2wcxf(C):
@@ -3,6 +3,8 @@
 
 import rundec
 from functools import lru_cache
+import numpy as np
+from scipy.interpolate import CubicSpline
 
 
 def _sane(scale, f):
@@ -147,3 +149,127 @@ def m_s(ms2, scale, f, alphasMZ=0.1185, loop=3):
         return crd.mL2mH(msmc, alphas_mc, mc, crd.nfMmu, scale, loop)
     else:
         raise ValueError(f"Invalid input: f={f}, scale={scale}")
+
+
+# Vectorized running based on interpolation tables.
+#
+# For given number of flavours, alpha_s(MZ) and loop order, alpha_s and the
+# ratio m(scale)/m(scale_0) of running quark masses (which is the same for
+# all quarks) are tabulated on a logarithmic grid of scales and interpolated
+# by cubic splines in log(scale) (of 1/alpha_s and the logarithm of the mass
+# ratio). The tables are computed when first needed, by running from the
+# reference scale scale_0 in `TABLE_SCALES_REF` within the theory with `f`
+# flavours. On the interpolation range `TABLE_SCALES`, the relative
+# interpolation error is below 1e-6; the results agree with the ones of the
+# scalar functions `alpha_s`, `m_b`, `m_c`, and `m_s` within a relative
+# precision of 1e-6 for alpha_s and 3e-5 for the quark masses (the latter
+# difference is due to the different treatment of the thresholds in RunDec).
+# Outside of this range, the scalar functions are used.
+
+TABLE_SCALES = np.geomspace(1, 1e4, 201)
+TABLE_SCALES_REF = {3: 2, 4: 3, 5: MZ, 6: 500}
+
+
+@lru_cache(32)
+def _table(f, alphasMZ=0.1185, loop=3):
+    r"""Return cubic splines in the logarithm of the scale of $1/\alpha_s$
+    and of the logarithm of the ratio of running quark masses at the scale
+    and at the reference scale in the theory with `f` flavours."""
+    _sane(1, f)
+    scale_0 = TABLE_SCALES_REF[f]
+    alphas_0 = alpha_s(scale_0, f, alphasMZ=alphasMZ, loop=loop)
+    crd = rundec.CRunDec()
+    alphas = np.array([crd.AlphasExact(alphas_0, scale_0, scale, f, loop)
+                       for scale in TABLE_SCALES])
+    ratios = np.array([crd.mMS2mMS(1, alphas_0, a, f, loop) for a in alphas])
+    x = np.log(TABLE_SCALES)
+    return CubicSpline(x, 1 / alphas), CubicSpline(x, np.log(ratios))
+
+
+def _in_table(scales):
+    """Return the scales as array and a boolean array indicating whether
+    they are within the range of the interpolation tables."""
+    scales = np.asarray(scales, dtype=float)
+    if np.any(scales <= 0):
+        raise ValueError("Scale must be a positive number")
+    return scales, (scales >= TABLE_SCALES[0]) & (scales <= TABLE_SCALES[-1])
+
+
+def alpha_s_array(scales, f, alphasMZ=0.1185, loop=3):
+    """Vectorized version of `alpha_s` based on interpolation tables,
+    returning an array of the shape of `scales`."""
+    scales, mask = _in_table(scales)
+    inv_alphas, _ = _table(f, alphasMZ=alphasMZ, loop=loop)
+    res = np.empty(scales.shape)
+    res[mask] = 1 / inv_alphas(np.log(scales[mask]))
+    res[~mask] = [alpha_s(scale, f, alphasMZ=alphasMZ, loop=loop)
+                  for scale in scales[~mask]]
+    return res
+
+
+def _mass_array(m, scales, f, alphasMZ, loop):
+    """Return an array of running quark masses at the scales `scales` from
+    the scalar function `m` of the scale, which is only evaluated outside of
+    the range of the interpolation tables and at the reference scale."""
+    scales, mask = _in_table(scales)
+    _, log_ratio = _table(f, alphasMZ=alphasMZ, loop=loop)
+    res = np.empty(scales.shape)
+    res[mask] = m(TABLE_SCALES_REF[f]) * np.exp(log_ratio(np.log(scales[mask])))
+    res[~mask] = [m(scale) for scale in scales[~mask]]
+    return res
+
+
+def m_b_array(mbmb, scales, f, alphasMZ=0.1185, loop=3):
+    """Vectorized version of `m_b` based on interpolation tables,
+    returning an array of the shape of `scales`."""
+    return _mass_array(lambda scale: m_b(mbmb, scale, f, alphasMZ, loop),
+                       scales, f, alphasMZ, loop)
+
+
+def m_c_array(mcmc, scales, f, alphasMZ=0.1185, loop=3):
+    """Vectorized version of `m_c` based on interpolation tables,
+    returning an array of the shape of `scales`."""
+    return _mass_array(lambda scale: m_c(mcmc, scale, f, alphasMZ, loop),
+                       scales, f, alphasMZ, loop)
+
+
+def m_s_array(ms2, scales, f, alphasMZ=0.1185, loop=3):
+    """Vectorized version of `m_s` based on interpolation tables,
+    returning an array of the shape of `scales`."""
+    return _mass_array(lambda scale: m_s(ms2, scale, f, alphasMZ, loop),
+                       scales, f, alphasMZ, loop)
+
+
+def running_parameters(scales, f, parameters, loop=3, exact=False):
+    r"""Return a dictionary with arrays of the shape of `scales` containing
+    $\alpha_s$ and the running quark masses 'm_b', 'm_c', 'm_s', 'm_u', and
+    'm_d' in the theory with `f` flavours, starting from the values of
+    these parameters in the dictionary `parameters` (see
+    `wilson.parameters`). The light quark masses 'm_u' and 'm_d' are given
+    at 2 GeV like 'm_s'.
+
+    By default, also a single scale is evaluated with the interpolation
+    tables, such that results for different scales are consistent. For
+    `exact=True`, the scalar functions `alpha_s`, `m_b`, `m_c`, and `m_s`
+    are evaluated for each scale instead."""
+    alphasMZ = parameters['alpha_s']
+    if exact:
+        scales = np.asarray(scales, dtype=float)
+        p = {'alpha_s': [alpha_s(scale, f, alphasMZ, loop=loop)
+                         for scale in scales.flat],
+             'm_b': [m_b(parameters['m_b'], scale, f, alphasMZ, loop=loop)
+                     for scale in scales.flat],
+             'm_c': [m_c(parameters['m_c'], scale, f, alphasMZ, loop=loop)
+                     for scale in scales.flat]}
+        for k in ['m_s', 'm_u', 'm_d']:
+            p[k] = [m_s(parameters[k], scale, f, alphasMZ, loop=loop)
+                    for scale in scales.flat]
+        return {k: np.reshape(v, scales.shape) for k, v in p.items()}
+    p = {'alpha_s': alpha_s_array(scales, f, alphasMZ=alphasMZ, loop=loop),
+         'm_b': m_b_array(parameters['m_b'], scales, f, alphasMZ, loop),
+         'm_c': m_c_array(parameters['m_c'], scales, f, alphasMZ, loop)}
+    # the running of the light quark masses is the same as the one of m_s
+    ms = m_s_array(1, scales, f, alphasMZ, loop)
+    for k in ['m_s', 'm_u', 'm_d']:
+        p[k] = parameters[k] * ms
+    return p
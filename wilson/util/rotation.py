@@ -0,0 +1,73 @@
+r"""Flavour rotations of Wilson coefficient arrays.
+
+A flavour rotation of a Wilson coefficient array $C$ with $n$ flavour indices
+is defined by one (or no) matrix per index,
+
+$$C'_{a_1\ldots a_n} = \sum_{i_1\ldots i_n} M^{(1)}_{i_1 a_1} \cdots
+M^{(n)}_{i_n a_n} C_{i_1\ldots i_n}.$$
+
+The matrices are specified by "rules", i.e. tuples with one entry per index
+containing the name of a rotation matrix, optionally followed by `*` for its
+complex conjugate, or `None` if the index is not rotated. All Wilson
+coefficients sharing the same rule are stacked and rotated at once, applying
+the matrices index by index as matrix multiplications, which avoids parsing
+einsum subscripts and searching contraction paths for every coefficient.
+"""
+
+import numpy as np
+
+
+def _group(C, rules):
+    """Return a dictionary with the rules as keys and the lists of names of
+    Wilson coefficients in `C` sharing them as values."""
+    groups = {}
+    for k, rule in rules.items():
+        if k in C:
+            groups.setdefault(rule, []).append(k)
+    return groups
+
+
+def _rotate_index(X, M, index, n):
+    """Rotate the index `index` of the last `n` axes of the array `X` by the
+    matrix `M`, which can carry leading batch axes."""
+    axis = X.ndim - n + index
+    X = np.moveaxis(X, axis, -1)
+    shape = X.shape
+    # flatten the remaining flavour indices to use a (batched) matmul
+    X = X.reshape(shape[:X.ndim - n] + (-1, shape[-1])) @ M[..., None, :, :]
+    X = X.reshape(shape[:-1] + (M.shape[-1],))
+    return np.moveaxis(X, -1, axis)
+
+
+def rotate(C, rules, matrices):
+    """Rotate Wilson coefficient arrays.
+
+    Parameters:
+
+    - `C`: dictionary of Wilson coefficient arrays. All arrays can carry
+      the same leading batch axes.
+    - `rules`: dictionary with Wilson coefficient names as keys and rules
+      (see the module docstring) as values.
+    - `matrices`: dictionary of rotation matrices. If the Wilson coefficients
+      carry leading batch axes, the matrices can carry the same ones.
+
+    Returns a dictionary with the rotated Wilson coefficients in `C`
+    having a rule in `rules`.
+    """
+    M = {}
+    for name, U in matrices.items():
+        U = np.asarray(U)
+        M[name] = U
+        M[name + '*'] = U.conj()
+    C_out = {}
+    for rule, keys in _group(C, rules).items():
+        X = np.stack([np.asarray(C[k]) for k in keys])
+        if X.ndim > len(rule) + 1:
+            # move the stacking axis behind the batch axes
+            X = np.moveaxis(X, 0, X.ndim - len(rule) - 1)
+        for index, name in enumerate(rule):
+            if name is not None:
+                X = _rotate_index(X, M[name], index, len(rule))
+        for i, k in enumerate(keys):
+            C_out[k] = X[(Ellipsis, i) + (slice(None),) * len(rule)]
+    return C_out
@@ -1,5 +1,6 @@
 import unittest
-from wilson.util.qcd import alpha_s, m_b, m_c, m_s
+import numpy as np
+from wilson.util.qcd import alpha_s, m_b, m_c, m_s, alpha_s_array, running_parameters
 
 # All numbers compared to Mathemetica version of RunDec
 
@@ -156,3 +157,49 @@ class TestAlphas(unittest.TestCase):
         self.assertAlmostEqual(alpha_s(1000, 3),
                                0.076593079980776995496,
                                delta=delta)
+
+
+class TestArray(unittest.TestCase):
+    def test_alphas_array(self):
+        scales = np.array([0.9, 1, 3, 50, 500, 1e4, 2e4])
+        for f in [3, 4, 5, 6]:
+            res = alpha_s_array(scales, f, alphasMZ=0.1181, loop=5)
+            self.assertEqual(res.shape, scales.shape)
+            for scale, r in zip(scales, res):
+                self.assertAlmostEqual(r / alpha_s(scale, f, alphasMZ=0.1181, loop=5),
+                                       1, delta=1e-6)
+        self.assertEqual(alpha_s_array(3, 4).shape, ())
+        with self.assertRaises(ValueError):
+            alpha_s_array([100, 0], 5)
+        with self.assertRaises(ValueError):
+            alpha_s_array(100, 7)
+
+    def test_running_parameters(self):
+        scales = np.geomspace(1, 1000, 11)
+        parameters = {'alpha_s': 0.1181, 'm_b': 4.163, 'm_c': 1.279,
+                      'm_s': 0.095, 'm_u': 0.002, 'm_d': 0.005}
+        for f in [3, 4, 5]:
+            p = running_parameters(scales, f, parameters)
+            for i, scale in enumerate(scales):
+                self.assertAlmostEqual(p['alpha_s'][i] / alpha_s(scale, f, 0.1181),
+                                       1, delta=1e-6)
+                self.assertAlmostEqual(p['m_b'][i] / m_b(4.163, scale, f, 0.1181),
+                                       1, delta=3e-5)
+                self.assertAlmostEqual(p['m_c'][i] / m_c(1.279, scale, f, 0.1181),
+                                       1, delta=3e-5)
+                self.assertAlmostEqual(p['m_u'][i] / m_s(0.002, scale, f, 0.1181),
+                                       1, delta=3e-5)
+        # a single scale is evaluated with the tables as well
+        p = running_parameters(4.2, 5, parameters)
+        p_array = running_parameters([4.2], 5, parameters)
+        for k, v in p.items():
+            self.assertEqual(v.shape, ())
+            self.assertEqual(v, p_array[k][0])
+        # unless the exact values are requested
+        p = running_parameters(4.2, 5, parameters, exact=True)
+        self.assertEqual(p['alpha_s'], alpha_s(4.2, 5, 0.1181))
+        self.assertEqual(p['m_b'], m_b(4.163, 4.2, 5, 0.1181))
+        self.assertEqual(p['m_d'], m_s(0.005, 4.2, 5, 0.1181))
+        p = running_parameters(scales, 4, parameters, exact=True)
+        self.assertEqual(p['m_c'].shape, scales.shape)
+        self.assertEqual(p['m_c'][3], m_c(1.279, scales[3], 4, 0.1181))
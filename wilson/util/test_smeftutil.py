@@ -227,3 +227,46 @@ class TestKeysShapesSymm(unittest.TestCase):
 
     def test_needs_padding(self):
         self.assertEqual(smeftutil._needs_padding, False)
+
+
+class TestFlavorRotation(unittest.TestCase):
+    def test_rotation(self):
+        from wilson.util import smeft_warsaw
+        rng = np.random.default_rng(0)
+        U = {f: np.linalg.qr(rng.standard_normal((2, 3, 3))
+                             + 1j * rng.standard_normal((2, 3, 3)))[0]
+             for f in ['Uq', 'Uu', 'Ud', 'Ul', 'Ue']}
+        C_wc = {k: C[k] for k in smeftutil.WC_keys}
+        C_batch = {k: np.stack([C[k], 2 * C[k]]) for k in C_wc}
+        C_out = smeft_warsaw.flavor_rotation(C_batch, **U)
+        for i in range(2):
+            Ui = {f: U[f][i] for f in U}
+            C_i = smeft_warsaw.flavor_rotation(
+                {k: v[i] for k, v in C_batch.items()}, **Ui)
+            for k in C_wc:
+                npt.assert_allclose(C_out[k][i], C_i[k], atol=1e-14)
+        Ui = {f: U[f][0] for f in U}
+        npt.assert_allclose(smeft_warsaw.flavor_rotation(C_wc, **Ui)['ll'],
+            np.einsum('jb,ld,ia,kc,ijkl->abcd', Ui['Ul'], Ui['Ul'],
+                      Ui['Ul'].conj(), Ui['Ul'].conj(), C_wc['ll']),
+            atol=1e-14)
+        npt.assert_allclose(smeft_warsaw.flavor_rotation(C_wc, **Ui)['duql'],
+            np.einsum('jb,ld,ia,kc,ijkl->abcd', Ui['Uu'], Ui['Ul'],
+                      Ui['Ud'], Ui['Uq'], C_wc['duql']),
+            atol=1e-14)
+
+
+class TestPacking(unittest.TestCase):
+    def test_packing(self):
+        # number of independent real parameters: SM + WCxf basis
+        basis = wcxf.Basis['SMEFT', 'Warsaw']
+        n_wc = sum(1 if v.get('real', False) else 2
+                   for s in basis.sectors.values() for v in s.values())
+        n_sm = 5 + 3 * 2 * 9
+        self.assertEqual(smeftutil.packed_size, n_sm + n_wc)
+        y = smeftutil.C_dict2array(smeftutil.symmetrize(C)).astype(complex)
+        x = smeftutil.C_array2packed(y)
+        self.assertEqual(x.shape, (smeftutil.packed_size,))
+        npt.assert_allclose(smeftutil.C_packed2array(x), y, rtol=1e-15)
+        Y = smeftutil.C_packed2array(np.stack([x, 2 * x]))
+        npt.assert_allclose(Y[1], 2 * y, rtol=1e-15)
@@ -5,6 +5,7 @@ from wilson import wcxf
 import numpy as np
 import ckmutil
 from wilson.util import smeftutil
+from wilson.util.rotation import rotate
 
 
 # names of Wilson coefficients with the same fermionic symmetry properties
@@ -146,73 +147,58 @@ def symmetrize_JMS_dict(C):
     return Cs
 
 
+# rules for the rotation of the down-type quark fields from the flavour to
+# the mass basis, see `wilson.util.rotation`
+rotate_down_rules = {}
+## B conserving operators
+# type dL dR (dipoles)
+for k in ['dgamma', 'dG']:
+    rotate_down_rules[k] = ('UdL*', None)
+# type dL dL dL dL
+for k in ['VddLL']:
+    rotate_down_rules[k] = ('UdL*', 'UdL', 'UdL*', 'UdL')
+# type X X dL dL
+for k in ['V1udLL', 'V8udLL', 'VedLL', 'VnudLL']:
+    rotate_down_rules[k] = (None, None, 'UdL*', 'UdL')
+# type dL dL X X
+for k in ['V1ddLR', 'V1duLR', 'V8ddLR', 'V8duLR', 'VdeLR']:
+    rotate_down_rules[k] = ('UdL*', 'UdL', None, None)
+# type dL X dL X
+for k in ['S1ddRR', 'S8ddRR']:
+    rotate_down_rules[k] = ('UdL*', None, 'UdL*', None)
+# type X dL X X
+for k in ['V1udduLR', 'V8udduLR']:
+    rotate_down_rules[k] = (None, 'UdL', None, None)
+# type X X dL X
+for k in ['VnueduLL', 'SedRR', 'TedRR', 'SnueduRR', 'TnueduRR',
+          'S1udRR',  'S8udRR', 'S1udduRR',  'S8udduRR', ]:
+    rotate_down_rules[k] = (None, None, 'UdL*', None)
+# type X X X dL
+for k in ['SedRL', ]:
+    rotate_down_rules[k] = (None, None, None, 'UdL')
+## DeltaB=DeltaL=1 operators
+# type dL X X X
+for k in ['SduuLL',  'SduuLR']:
+    rotate_down_rules[k] = ('UdL', None, None, None)
+# type X X dL X
+for k in ['SuudRL', 'SdudRL']:
+    rotate_down_rules[k] = (None, None, 'UdL', None)
+# type X dL dL X
+for k in ['SuddLL']:
+    rotate_down_rules[k] = (None, 'UdL', 'UdL', None)
+
+
 def rotate_down(C_in, p):
     """Redefinition of all Wilson coefficients in the JMS basis when rotating
     down-type quark fields from the flavour to the mass basis.
 
     C_in is expected to be an array-valued dictionary containg a key
-    for all Wilson coefficient matrices."""
+    for all Wilson coefficient matrices. The arrays can carry a common
+    leading batch axis."""
     C = C_in.copy()
     V = ckmutil.ckm.ckm_tree(p["Vus"], p["Vub"], p["Vcb"], p["gamma"])
     UdL = V
-    ## B conserving operators
-    # type dL dR (dipoles)
-    for k in ['dgamma', 'dG']:
-        C[k] = np.einsum('ia,ij->aj',
-                         UdL.conj(),
-                         C_in[k])
-    # type dL dL dL dL
-    for k in ['VddLL']:
-        C[k] = np.einsum('ia,jb,kc,ld,ijkl->abcd',
-                         UdL.conj(), UdL, UdL.conj(), UdL,
-                         C_in[k])
-    # type X X dL dL
-    for k in ['V1udLL', 'V8udLL', 'VedLL', 'VnudLL']:
-        C[k] = np.einsum('kc,ld,ijkl->ijcd',
-                         UdL.conj(), UdL,
-                         C_in[k])
-    # type dL dL X X
-    for k in ['V1ddLR', 'V1duLR', 'V8ddLR', 'V8duLR', 'VdeLR']:
-        C[k] = np.einsum('ia,jb,ijkl->abkl',
-                         UdL.conj(), UdL,
-                         C_in[k])
-    # type dL X dL X
-    for k in ['S1ddRR', 'S8ddRR']:
-        C[k] = np.einsum('ia,kc,ijkl->ajcl',
-                         UdL.conj(), UdL.conj(),
-                         C_in[k])
-    # type X dL X X
-    for k in ['V1udduLR', 'V8udduLR']:
-        C[k] = np.einsum('jb,ijkl->ibkl',
-                         UdL,
-                         C_in[k])
-    # type X X dL X
-    for k in ['VnueduLL', 'SedRR', 'TedRR', 'SnueduRR', 'TnueduRR',
-              'S1udRR',  'S8udRR', 'S1udduRR',  'S8udduRR', ]:
-        C[k] = np.einsum('kc,ijkl->ijcl',
-                         UdL.conj(),
-                         C_in[k])
-    # type X X X dL
-    for k in ['SedRL', ]:
-        C[k] = np.einsum('ld,ijkl->ijkd',
-                         UdL,
-                         C_in[k])
-    ## DeltaB=DeltaL=1 operators
-    # type dL X X X
-    for k in ['SduuLL',  'SduuLR']:
-        C[k] = np.einsum('ia,ijkl->ajkl',
-                         UdL,
-                         C_in[k])
-    # type X X dL X
-    for k in ['SuudRL', 'SdudRL']:
-        C[k] = np.einsum('kc,ijkl->ijcl',
-                         UdL,
-                         C_in[k])
-    # type X dL dL X
-    for k in ['SuddLL']:
-        C[k] = np.einsum('jb,kc,ijkl->ibcl',
-                         UdL, UdL,
-                         C_in[k])
+    C.update(rotate(C_in, rotate_down_rules, dict(UdL=UdL)))
     return C
 
 